@@ -4,6 +4,7 @@ Handles PostgreSQL database connections and operations
 """
 
 import asyncio
+import json
 import logging
 from typing import List, Dict, Any, Optional, Union
 import asyncpg
@@ -11,8 +12,43 @@ from contextlib import asynccontextmanager
 import os
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Version byte that prefixes jsonb values in PostgreSQL's binary wire format
+JSONB_BINARY_VERSION = b'\x01'
+
+async def _init_connection(connection):
+    """Let JSON/JSONB parameters and results be plain Python objects"""
+    if ORJSON_AVAILABLE:
+        # Binary format hands orjson's bytes straight to the wire, no str round trip
+        await connection.set_type_codec(
+            'jsonb',
+            encoder=lambda value: JSONB_BINARY_VERSION + orjson.dumps(value, default=str),
+            decoder=lambda data: orjson.loads(data[1:]),
+            schema='pg_catalog',
+            format='binary',
+        )
+        await connection.set_type_codec(
+            'json',
+            encoder=lambda value: orjson.dumps(value, default=str).decode(),
+            decoder=orjson.loads,
+            schema='pg_catalog',
+        )
+    else:
+        for type_name in ('jsonb', 'json'):
+            await connection.set_type_codec(
+                type_name,
+                encoder=lambda value: json.dumps(value, default=str),
+                decoder=json.loads,
+                schema='pg_catalog',
+            )
+
 class DatabaseConnection:
     """Database connection handler for PostgreSQL"""
     
@@ -51,7 +87,8 @@ class DatabaseConnection:
                     self.connection_string,
                     min_size=5,
                     max_size=20,
-                    command_timeout=60
+                    command_timeout=60,
+                    init=_init_connection
                 )
                 logger.info("PostgreSQL connection pool created")
         except Exception as e:
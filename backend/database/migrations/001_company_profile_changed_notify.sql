@@ -0,0 +1,15 @@
+-- Adds the company_profile_changed notification (see schema.sql) to databases
+-- created before it existed. Safe to run more than once:
+--   psql "$DATABASE_URL" -f backend/database/migrations/001_company_profile_changed_notify.sql
+
+-- Tell API processes caching company profiles which one changed
+CREATE OR REPLACE FUNCTION notify_company_profile_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('company_profile_changed', NEW.company_id::text);
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS company_profile_changed_notify ON company_profiles;
+CREATE TRIGGER company_profile_changed_notify AFTER INSERT OR UPDATE ON company_profiles FOR EACH ROW EXECUTE FUNCTION notify_company_profile_changed();
@@ -153,3 +153,14 @@ CREATE TRIGGER update_companies_updated_at BEFORE UPDATE ON companies FOR EACH R
 CREATE TRIGGER update_contacts_updated_at BEFORE UPDATE ON contacts FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_company_profiles_updated_at BEFORE UPDATE ON company_profiles FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_outreach_content_updated_at BEFORE UPDATE ON outreach_content FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Tell API processes caching company profiles which one changed
+CREATE OR REPLACE FUNCTION notify_company_profile_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('company_profile_changed', NEW.company_id::text);
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER company_profile_changed_notify AFTER INSERT OR UPDATE ON company_profiles FOR EACH ROW EXECUTE FUNCTION notify_company_profile_changed();
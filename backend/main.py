@@ -22,6 +22,7 @@ from .services.company_discovery import CompanyDiscoveryService
 from .services.contact_identification import ContactIdentificationService
 from .services.research_engine import ResearchEngine
 from .services.outreach_generator import OutreachGenerator
+from .services.real_research import close_research_engine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -52,6 +53,18 @@ contact_identification = job_orchestrator.contact_identification
 research_engine = job_orchestrator.research_engine
 outreach_generator = job_orchestrator.outreach_generator
 
+@app.on_event("startup")
+async def startup():
+    """Start listening for company profile changes so cached profiles are evicted"""
+    await research_engine.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release the pooled HTTP sessions and database connections shared by the services"""
+    await close_research_engine()
+    await research_engine.aclose()
+    await job_orchestrator.db.disconnect()
+
 @app.get("/")
 async def root():
     return {"message": "AI Lead Generation Platform API", "version": "2.0.0"}
@@ -156,10 +169,11 @@ async def get_company_profile(company_id: str):
 async def trigger_research(
     company_id: str,
     background_tasks: BackgroundTasks,
+    force_refresh: bool = False,
 ):
     """Trigger deep research for a company"""
     background_tasks.add_task(
-        research_engine.research_company, company_id
+        research_engine.research_company, company_id, force_refresh
     )
     return {"message": "Research initiated"}
 
@@ -33,6 +33,8 @@ try:
         search_companies,
         research_company_deep,
         find_company_contacts,
+        warm_up_research_engine,
+        close_research_engine,
     )
     from services.investor_discovery import discover_investor_companies
     from services.ai_research import AIResearchService
@@ -659,6 +661,18 @@ async def process_job_real_only(job_id: str, job_data: dict):
 
 # API Endpoints
 
+@app.on_event("startup")
+async def startup():
+    """Open LLM API connections before the first job needs them"""
+    if REAL_RESEARCH_AVAILABLE:
+        await warm_up_research_engine()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections held by the research engine"""
+    if REAL_RESEARCH_AVAILABLE:
+        await close_research_engine()
+
 @app.get("/")
 async def root():
     """Serve frontend"""
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 from ..database.connection import DatabaseConnection
 from ..models.schemas import ContactResponse, ContactSeniority
 from .real_research import find_company_contacts, extract_targeting_criteria
+from .web_scraper import matches_target_roles
 
 logger = logging.getLogger(__name__)
 
@@ -186,31 +187,20 @@ class ContactIdentificationService:
         if not contacts:
             return []
 
-        target_roles = []
-        if criteria:
-            target_roles = [role.lower() for role in criteria.get("target_roles", []) if role]
-
-        role_keywords = set()
-        for role in target_roles:
-            role_keywords.update(role.split())
-
-        def matches_target(contact_role: str) -> bool:
-            if not role_keywords:
-                return True
-            contact_role = (contact_role or "").lower()
-            return any(keyword in contact_role for keyword in role_keywords)
+        target_roles = criteria.get("target_roles") if criteria else None
 
         seen_keys = set()
         filtered: List[Dict[str, Any]] = []
 
         for contact in contacts:
             role = contact.get("role") or contact.get("title") or ""
+            role_lower = role.lower()
             name = contact.get("contact_name") or contact.get("name") or ""
 
             if not self._looks_like_person(name):
                 continue
 
-            if not matches_target(role):
+            if not matches_target_roles(role, target_roles):
                 continue
 
             if not (contact.get("linkedin") or contact.get("email")):
@@ -220,7 +210,7 @@ class ContactIdentificationService:
             name_key = (contact.get("contact_name") or contact.get("name") or "").strip().lower()
             linkedin_key = (contact.get("linkedin") or "").strip().lower()
             email_key = (contact.get("email") or "").strip().lower()
-            dedupe_key = (name_key, role.lower(), linkedin_key, email_key)
+            dedupe_key = (name_key, role_lower, linkedin_key, email_key)
 
             if dedupe_key in seen_keys:
                 continue
@@ -77,6 +77,8 @@ class JobOrchestrator:
                 await self.contact_identification.identify_contacts(company.id)
                 await self.research_engine.research_company(company.id)
                 await self.outreach_generator.generate_company_outreach(company.id)
+            # The job's quality score is read from company_profiles
+            await self.research_engine.flush_pending_writes()
 
             await self.qa_service.run_qa_pipeline(job_id)
             await self.export_service.export_job_results(job_id)
@@ -12,7 +12,7 @@ from typing import Dict, List, Optional
 
 from ..database.connection import DatabaseConnection
 from ..models.schemas import OutreachContentResponse, OutreachChannel
-from .real_research import generate_personalized_outreach
+from .real_research import iter_personalized_outreach
 
 logger = logging.getLogger(__name__)
 
@@ -37,15 +37,19 @@ class OutreachGenerator:
             logger.info("No contacts/company found for outreach generation (company_id=%s)", company_id)
             return []
 
-        generated: List[OutreachContentResponse] = []
-        for contact in contacts:
-            outreach_payload = await generate_personalized_outreach(
+        # Contacts are batched into few LLM calls; each result is stored as soon as
+        # its batch returns instead of after the slowest one
+        generated: List[Optional[OutreachContentResponse]] = [None] * len(contacts)
+        async for index, outreach_payload in iter_personalized_outreach(
+            [
                 {
                     "company": company,
                     "contact": contact,
                 }
-            )
-
+                for contact in contacts
+            ]
+        ):
+            contact = contacts[index]
             content_id = str(uuid.uuid4())
             payload = {
                 "id": content_id,
@@ -90,27 +94,25 @@ class OutreachGenerator:
                 payload["updated_at"],
             )
 
-            generated.append(
-                OutreachContentResponse(
-                    **{
-                        "id": payload["id"],
-                        "company_id": payload["company_id"],
-                        "contact_id": payload["contact_id"],
-                        "channel": payload["channel"],
-                        "subject": payload["subject"],
-                        "body": payload["body"],
-                        "tone": payload["tone"],
-                        "word_count": payload["word_count"],
-                        "qa_feedback": payload["qa_feedback"],
-                        "quality_score": payload["quality_score"],
-                        "status": payload["status"],
-                        "created_at": payload["created_at"],
-                        "updated_at": payload["updated_at"],
-                    }
-                )
+            generated[index] = OutreachContentResponse(
+                **{
+                    "id": payload["id"],
+                    "company_id": payload["company_id"],
+                    "contact_id": payload["contact_id"],
+                    "channel": payload["channel"],
+                    "subject": payload["subject"],
+                    "body": payload["body"],
+                    "tone": payload["tone"],
+                    "word_count": payload["word_count"],
+                    "qa_feedback": payload["qa_feedback"],
+                    "quality_score": payload["quality_score"],
+                    "status": payload["status"],
+                    "created_at": payload["created_at"],
+                    "updated_at": payload["updated_at"],
+                }
             )
 
-        return generated
+        return [response for response in generated if response is not None]
 
     async def get_outreach_content(
         self,
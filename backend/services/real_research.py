@@ -6,10 +6,18 @@ Replaces simulation with actual Google Custom Search, company research, and outr
 import os
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from datetime import datetime, timezone
 import json
 import re
+import hashlib
+import random
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import product
+from types import MappingProxyType
 from urllib.parse import urlparse, urljoin
 
 # Import HTTP client
@@ -20,6 +28,14 @@ except ImportError:
     AIOHTTP_AVAILABLE = False
     logging.warning("aiohttp not available, using requests fallback")
 
+# Import HTTP client shared by the LLM SDKs (HTTP/2 needs the optional h2 package)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+HTTP2_AVAILABLE = HTTPX_AVAILABLE and find_spec("h2") is not None
+
 # Import AI clients
 try:
     from openai import AsyncOpenAI
@@ -35,8 +51,545 @@ except ImportError:
     CLAUDE_AVAILABLE = False
     logging.warning("Anthropic Claude not available")
 
+# Import fast JSON parser (stdlib json is used when orjson is missing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import HTML parsers for website text extraction (selectolax preferred, BeautifulSoup fallback)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# Import on-disk cache for paid API responses (skipped when diskcache is missing)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Import web scraper used for contact discovery
+try:
+    from .web_scraper import scrape_company_contacts, close_web_scraper
+except ImportError:
+    scrape_company_contacts = None
+    close_web_scraper = None
+    logger.warning("Web scraper not available")
+
+# Scraped contacts are reused per (domain, target roles) for up to an hour
+CONTACT_CACHE_MAX_ENTRIES = 500
+CONTACT_CACHE_TTL_SECONDS = 3600
+
+# Google search results, extracted targeting criteria, company analyses and
+# outreach are cached on disk (their only cache layer) so repeated runs do not
+# pay for identical API calls
+RESPONSE_CACHE_DIR = os.getenv("RESEARCH_CACHE_DIR", "/tmp/ai_lead_scrape_cache")
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+# Company analyses and outreach are paid LLM calls; their results persist for a day
+LLM_RESPONSE_CACHE_TTL_SECONDS = 86400
+
+# Google results for a (query, num) live longer than other responses; rankings
+# for the generated queries rarely change within hours
+GOOGLE_CACHE_TTL_SECONDS = int(os.getenv("GOOGLE_CACHE_TTL_SECONDS", str(6 * 3600)))
+
+# Optional OpenAI-compatible endpoint for targeting extraction, e.g. a llama.cpp
+# server running a quantized model; the hosted APIs remain the fallback
+EXTRACTION_BASE_URL = os.getenv("EXTRACTION_BASE_URL")
+EXTRACTION_MODEL = os.getenv("EXTRACTION_MODEL", "local")
+
+# Short prompts such as "B2B SaaS startups in Berlin" are parsed without an LLM
+# call when an industry, a location and at least two keywords are recognized
+FAST_PATH_MAX_WORDS = 12
+FAST_PATH_MIN_KEYWORDS = 2
+FAST_PATH_INDUSTRIES = {
+    "saas": "SaaS",
+    "software": "Software",
+    "fintech": "FinTech",
+    "healthtech": "HealthTech",
+    "edtech": "EdTech",
+    "proptech": "PropTech",
+    "biotech": "Biotech",
+    "ecommerce": "E-commerce",
+    "e-commerce": "E-commerce",
+    "cybersecurity": "Cybersecurity",
+    "logistics": "Logistics",
+    "manufacturing": "Manufacturing",
+    "insurance": "Insurance",
+    "marketing": "Marketing",
+    "ai": "Artificial Intelligence",
+}
+# Words that add nothing to a search query once industry and location are known
+FAST_PATH_STOPWORDS = {
+    "find", "get", "me", "list", "of", "the", "a", "an", "and", "for", "in", "based",
+    "located", "companies", "company", "startups", "startup", "firms", "businesses", "leads",
+}
+# Descriptive words the fast path keeps as keywords. Any other word (a role such
+# as "CTOs", a size such as "50-200 employees", "at", "with", ...) sends the
+# prompt to the LLM, which extracts target_roles and company_size
+FAST_PATH_KEYWORDS = {
+    "b2b", "b2c", "d2c", "enterprise", "consumer", "payments", "platform", "platforms",
+    "marketplace", "marketplaces", "cloud", "mobile", "online", "digital", "data",
+    "analytics", "security", "hardware", "devtools", "api",
+}
+# Investor/developer prompts need the LLM's LP-vs-developer distinction (whole words only)
+FAST_PATH_EXCLUDED_TERMS = (
+    "investor", "investors", "invest", "investing", "investment", "investments",
+    "fund", "funds", "capital", "reit", "reits", "equity", "portfolio", "portfolios",
+    "developer", "developers", "development", "builder", "builders", "construction",
+    "guide", "guides", "knowledge",
+)
+_RE_FAST_EXCLUDED = re.compile(r'\b(?:' + '|'.join(FAST_PATH_EXCLUDED_TERMS) + r')\b', re.I)
+_RE_FAST_LOCATION = re.compile(r'\b(?:in|based in|located in)\s+([A-Z][\w.\-]*(?:\s+[A-Z][\w.\-]*)*)')
+
+# Query templates expanded from structured targeting fields in search_companies
+SEARCH_QUERY_CACHE_MAX_ENTRIES = 512
+INDUSTRY_LOCATION_QUERY_TEMPLATES = (
+    "{industry} companies {location}",
+    "top {industry} businesses {location}",
+    "{industry} startups {location}",
+)
+KEYWORD_LOCATION_QUERY_TEMPLATES = ("{keyword} companies {location}", "{keyword} startups {location}")
+INDUSTRY_KEYWORD_QUERY_TEMPLATES = ("{industry} {keyword} companies",)
+KEYWORD_QUERY_TEMPLATES = ("{keyword} company directory", "best {keyword} companies")
+KEYWORD_FALLBACK_QUERY_TEMPLATES = ("{keyword} companies", "{keyword} startups")
+
+# Job boards and recruitment sites; configure these as "Sites to exclude" in the
+# programmable search engine so queries need no -site: operators
+JOB_BOARD_SITES = (
+    "linkedin.com/jobs",
+    "indeed.com",
+    "glassdoor.com",
+    "ziprecruiter.com",
+    "monster.com",
+    "careerbuilder.com",
+    "flexjobs.com",
+    "simplyhired.com",
+    "dice.com",
+    "crunchbase.com/jobs",
+)
+
+# Concurrency ceilings for outbound calls and retry policy for overloaded LLM APIs
+HTTP_MAX_CONCURRENCY = 16
+LLM_MAX_CONCURRENCY = 4
+LLM_MAX_RETRIES = 3
+OVERLOAD_STATUS_CODES = {429, 503, 529}
+
+# Timeouts for Google and website requests: connect and per-read limits stop one
+# stalled host from holding a search or research fan-out until the total expires
+if AIOHTTP_AVAILABLE:
+    GOOGLE_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_read=10)
+    WEBSITE_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=5)
+HTTP_DNS_CACHE_TTL_SECONDS = 300
+
+# Smoothing factor for the per-provider latency average used to route outreach
+# calls, its starting value (seconds), and the latency charged for a failed call
+LLM_LATENCY_EWMA_ALPHA = 0.2
+LLM_LATENCY_INITIAL_SECONDS = 1.0
+LLM_FAILURE_LATENCY_SECONDS = 120
+
+# Client-side request rate per LLM provider; raise these after a tier upgrade
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+CLAUDE_REQUESTS_PER_MINUTE = int(os.getenv("CLAUDE_REQUESTS_PER_MINUTE", "50"))
+
+# Connection pool shared by the OpenAI/Claude clients so calls reuse warm TLS connections
+LLM_HTTP_MAX_CONNECTIONS = 200
+LLM_HTTP_MAX_KEEPALIVE = 100
+LLM_HTTP_TIMEOUT_SECONDS = 120
+
+# Google Custom Search concurrency starts at GOOGLE_SEARCH_CONCURRENCY and adapts
+# (AIMD) between 1 and GOOGLE_SEARCH_MAX_CONCURRENCY; rate-limited calls are retried
+GOOGLE_SEARCH_CONCURRENCY = 5
+GOOGLE_SEARCH_MAX_CONCURRENCY = 10
+GOOGLE_MAX_RETRIES = 3
+
+# Client-side Google Custom Search request budget: (max requests, window in seconds)
+GOOGLE_RATE_LIMITS = ((10, 1.0), (60, 60.0))
+
+# Website scraping reads at most this many bytes and keeps this many characters of
+# visible text; the first few KB of a page are mostly <head>, scripts and styles
+WEBSITE_MAX_BYTES = 65536
+WEBSITE_MAX_CHARS = 5000
+# Elements whose contents are never visible page text
+NON_TEXT_TAGS = ["script", "style", "noscript", "template", "svg"]
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml", "text/plain"}
+
+# Technology indicators detected on company websites, matched in a single regex pass
+TECH_INDICATORS = ["React", "Angular", "Vue", "Node.js", "Python", "Java", "AWS", "Azure", "Google Cloud"]
+_RE_TECH = re.compile(r'\b(' + '|'.join(re.escape(tech) for tech in TECH_INDICATORS) + r')\b', re.I)
+
+# Company analysis: the fixed instructions and schema live in a system prompt so
+# providers can cache the shared prefix; only company details vary per call
+ANALYSIS_OPENAI_MODEL = "gpt-4o-mini"
+ANALYSIS_CLAUDE_MODEL = "claude-3-5-haiku-20241022"
+ANALYSIS_SYSTEM_PROMPT = """You analyze companies as sales prospects.
+Return a JSON object with exactly these keys, each a list of short strings:
+{
+    "pain_points": ["Likely pain points"],
+    "growth_signals": ["Signs of growth or expansion"],
+    "technology_needs": ["Technology needs or gaps"],
+    "buying_triggers": ["What might trigger a purchase"],
+    "key_decision_makers": ["Types of decision makers to target"],
+    "reasons_to_reach_out": ["Why this company is a good prospect"]
+}"""
+
+# OpenAI structured output for one analysis: the API enforces these exact keys
+ANALYSIS_FIELDS = (
+    "pain_points", "growth_signals", "technology_needs",
+    "buying_triggers", "key_decision_makers", "reasons_to_reach_out",
+)
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {field: {"type": "array", "items": {"type": "string"}} for field in ANALYSIS_FIELDS},
+    "required": list(ANALYSIS_FIELDS),
+    "additionalProperties": False,
+}
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "company_analysis", "strict": True, "schema": ANALYSIS_SCHEMA},
+}
+
+# Concurrent single-company analyses arriving within this window share one batch call
+ANALYSIS_BATCH_WINDOW_SECONDS = 0.05
+
+# Companies scraped in parallel by research_companies_deep
+RESEARCH_CONCURRENCY = 8
+
+# Batched analysis: several companies, each introduced by "[id]", in one call
+ANALYSIS_BATCH_SIZE = 10
+ANALYSIS_BATCH_SYSTEM_PROMPT = """You analyze companies as sales prospects.
+You receive several companies, each introduced by its id in square brackets.
+Return a JSON object mapping every id (as a string, without brackets) to an object
+with exactly these keys, each a list of short strings:
+pain_points, growth_signals, technology_needs, buying_triggers,
+key_decision_makers, reasons_to_reach_out"""
+
+# Output format for outreach generation; paired with JSON mode (OpenAI) or a
+# "{" prefill (Claude) so replies are bare JSON objects
+OUTREACH_SYSTEM_PROMPT = """You write personalized B2B sales outreach.
+Return a JSON object with exactly these keys:
+linkedin_message (max 300 characters), email_subject (max 50 characters),
+email_body (max 200 words)"""
+OUTREACH_BATCH_SYSTEM_PROMPT = """You write personalized B2B sales outreach.
+Return a JSON object mapping every contact_id to an object with exactly these keys:
+linkedin_message (max 300 characters), email_subject (max 50 characters),
+email_body (max 200 words)"""
+
+# Outreach user prompts: static text is fixed here, only per-lead fields are filled in
+OUTREACH_PROMPT_TEMPLATE = """Generate personalized outreach messages for:
+
+Contact: {contact_name} ({role}) at {company}
+Company Research: {research}
+
+Make it personal, relevant, and valuable. Reference specific insights from the research."""
+OUTREACH_COMPANY_BATCH_PROMPT_TEMPLATE = """Generate personalized outreach messages for each contact at {company}.
+
+Company Research: {research}
+Contacts: {contacts}
+
+Make each message personal to the contact's role and reference specific insights from the research."""
+OUTREACH_MIXED_BATCH_PROMPT_TEMPLATE = """Generate personalized outreach messages for each contact, using their company and research.
+Contacts: {contacts}
+
+Make each message personal to the contact's role and reference specific insights from the research."""
+
+# Template outreach used when no AI client is configured or generation fails
+GENERIC_OUTREACH = {
+    "linkedin_message": "Hi! I'd love to connect and discuss how we can help your business grow.",
+    "email_subject": "Partnership Opportunity",
+    "email_body": "Hi there, I'd love to discuss a potential partnership opportunity."
+}
+OUTREACH_FALLBACK_TEMPLATES = {
+    "linkedin_message": "Hi {contact_name}, I'd love to connect and discuss how we can help {company} grow.",
+    "email_subject": "Partnership Opportunity for {company}",
+    "email_body": "Hi {contact_name}, I'd love to discuss a potential partnership opportunity for {company}."
+}
+
+# Contacts per outreach LLM call; larger lists are split into concurrent batches
+OUTREACH_BATCH_SIZE = 8
+
+# Outreach prompts carry a short research brief instead of the raw research blob
+RESEARCH_SUMMARY_MAX_CHARS = 300
+
+# Search result titles are cut at the first dash, pipe or colon ("Acme - Home")
+_RE_TITLE_TAIL = re.compile(r'\s*[-|:].*$')
+
+# Title patterns (checked against the lowercased title) that mark a search result as an article
+ARTICLE_TITLE_PATTERNS = tuple(
+    (re.compile(pattern), reason) for pattern, reason in (
+        (r'\?', "Contains question mark (article)"),
+        (r'\bhow\s+to\b', "How-to guide"),
+        (r'\btop\s+\d+', "Top N list article"),
+        (r'\bbest\s+\d+', "Best of list article"),
+        (r'\bguide\b', "Guide article"),
+        (r'\btips\b', "Tips article"),
+        (r'\bwhy\s+', "Why question article"),
+        (r'\bwhat\s+', "What question article"),
+        (r'\bfind\s+', "Find X article"),
+        (r'\bultimate\b', "Ultimate guide"),
+        (r'\bcomplete\b', "Complete guide"),
+        (r'\bbeginner', "Beginner guide"),
+        (r'\bcourse\b', "Course/tutorial"),
+        (r'\blesson\b', "Lesson/tutorial"),
+        (r'\btutorial\b', "Tutorial"),
+        (r'\bopportunit', "Opportunity article"),
+        (r'\bpotential\b', "Opportunity article"),
+        (r'\beconomic\b', "Economic analysis article"),
+        (r'technology\s+leads', "Technology leads article"),
+    )
+)
+
+# Date-stamped paths (/2024/01/31/) are news or blog posts
+_RE_DATED_URL = re.compile(r'/20\d{2}/\d{2}/\d{2}/')
+
+# Role keywords that mark a scraped contact as senior
+_RE_SENIOR = re.compile(r'director|vp|chief|head|manager', re.I)
+
+@lru_cache(maxsize=4096)
+def _extract_company_name(title: str) -> str:
+    """Extract company name from search result title (memoized across searches)"""
+    # Remove common suffixes (everything after the first dash, pipe or colon)
+    return _RE_TITLE_TAIL.sub('', title).strip()
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> str:
+    """Extract domain from URL (memoized; search results repeat hosts often)"""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        # Remove www prefix
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+    except:
+        return ""
+
+def _is_job_board_url(url: str) -> bool:
+    """True when url is on a JOB_BOARD_SITES host or one of its subdomains
+    
+    Entries with a path ("linkedin.com/jobs") only match URLs under that path.
+    """
+    try:
+        parsed = urlparse(url if "//" in url else f"//{url}")
+    except ValueError:
+        return False
+    host = (parsed.hostname or "").lower()
+    path = parsed.path.lower().rstrip("/") + "/"
+    for site in JOB_BOARD_SITES:
+        site_host, _, site_path = site.partition("/")
+        if host != site_host and not host.endswith("." + site_host):
+            continue
+        if path.startswith(f"/{site_path}/" if site_path else "/"):
+            return True
+    return False
+
+def _html_to_text(html: str) -> str:
+    """Visible text of an HTML document, whitespace-collapsed and capped at WEBSITE_MAX_CHARS"""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(NON_TEXT_TAGS)
+        text = tree.root.text(separator=" ") if tree.root else ""
+    elif BS4_AVAILABLE:
+        soup = BeautifulSoup(html, "html.parser")
+        for tag in soup(NON_TEXT_TAGS):
+            tag.decompose()
+        text = soup.get_text(" ")
+    else:
+        text = html
+    return " ".join(text.split())[:WEBSITE_MAX_CHARS]
+
+@lru_cache(maxsize=SEARCH_QUERY_CACHE_MAX_ENTRIES)
+def _build_search_queries(keywords: Tuple[str, ...], industry: str, location: str, company_size: str,
+                          original_prompt: str, ai_queries: Tuple[str, ...],
+                          custom_queries: Tuple[str, ...]) -> Tuple[Tuple[str, ...], str]:
+    """Google queries for a set of targeting criteria, in priority order and deduplicated
+    
+    Returns the queries and which fallback produced them ("keywords", "prompt" or
+    "" when AI or structured queries were available); the caller does the logging
+    because this result is memoized.
+    """
+    search_queries = []
+    fallback = ""
+    
+    # PRIORITY 1: Use AI-generated search queries from research guide analysis (MOST SPECIFIC)
+    if ai_queries:
+        search_queries.extend(ai_queries)
+    
+    # PRIORITY 2: Build complementary queries from structured fields (AS FALLBACK/SUPPLEMENT)
+    # Only add these if we don't have enough AI queries
+    if len(search_queries) < 10:
+        # 1. Highly targeted queries combining all parameters
+        if industry and location and keywords:
+            # "Technology companies in San Francisco AI SaaS"
+            search_queries.append(f"{industry} companies in {location} {' '.join(keywords[:2])}")
+            # "San Francisco Technology startups AI machine learning"
+            search_queries.append(f"{location} {industry} startups {' '.join(keywords[:3])}")
+        
+        # 2. Industry + location specific
+        if industry and location:
+            search_queries.extend(
+                template.format(industry=industry, location=location)
+                for template in INDUSTRY_LOCATION_QUERY_TEMPLATES
+            )
+        
+        # 3. Keyword-focused with location
+        if keywords and location:
+            search_queries.extend(
+                template.format(keyword=keyword, location=location)
+                for keyword, template in product(keywords[:3], KEYWORD_LOCATION_QUERY_TEMPLATES)
+            )
+        
+        # 4. Industry + keyword combinations
+        if industry and keywords:
+            search_queries.extend(
+                template.format(industry=industry, keyword=keyword)
+                for keyword, template in product(keywords[:3], INDUSTRY_KEYWORD_QUERY_TEMPLATES)
+            )
+        
+        # 5. Company size specific searches
+        if company_size and industry and location:
+            size_term = "startups" if "Startup" in company_size else "companies"
+            search_queries.append(f"{company_size.split('(')[0].strip()} {industry} {size_term} {location}")
+        
+        # 6. Pure keyword searches (broader)
+        search_queries.extend(
+            template.format(keyword=keyword)
+            for keyword, template in product(keywords[:2], KEYWORD_QUERY_TEMPLATES)
+        )
+    
+    # PRIORITY 3: Fallback to keywords if still no queries
+    if len(search_queries) == 0 and keywords:
+        fallback = "keywords"
+        search_queries.extend(
+            template.format(keyword=keyword)
+            for keyword, template in product(keywords[:5], KEYWORD_FALLBACK_QUERY_TEMPLATES)
+        )
+    
+    # PRIORITY 4: Last resort - use original prompt
+    if len(search_queries) == 0 and original_prompt:
+        fallback = "prompt"
+        search_queries.append(original_prompt)
+        # Extract words from prompt as additional queries
+        prompt_words = [w for w in original_prompt.split() if len(w) > 4][:5]
+        for word in prompt_words:
+            search_queries.append(f"{word} companies")
+
+    if custom_queries:
+        search_queries.extend(q for q in custom_queries if q)
+
+    core_queries = [
+        "institutional build-to-rent investors Sunbelt",
+        "opportunity zone multifamily capital partner",
+        "limited partner multifamily equity Phoenix",
+        "Sunbelt multifamily fund manager",
+        "qualified opportunity fund multifamily investor",
+    ]
+    search_queries.extend(core_queries)
+
+    # Order-preserving dedup so no Google API call is spent on a repeated query
+    return tuple(dict.fromkeys(search_queries)), fallback
+
+def _as_query_terms(value: Any) -> Tuple[str, ...]:
+    """Criteria list field as a hashable tuple of strings (a bare string is one term)"""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(str(term) for term in value if term)
+
+def _as_query_text(value: Any) -> str:
+    return str(value) if value else ""
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+def _utc_now_iso() -> str:
+    """Current UTC time as a second-precision ISO string, built at most once per second"""
+    return _iso_timestamp(int(time.time()))
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted with AIMD (additive increase, multiplicative decrease)
+    
+    Each success raises the limit by `increase`; each overload signal multiplies
+    it by `decrease`, never going below `minimum` or above `maximum`.
+    """
+    
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 10,
+                 increase: float = 0.5, decrease: float = 0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+    
+    def on_success(self):
+        self.limit = min(self.maximum, self.limit + self.increase)
+    
+    def on_overload(self):
+        self.limit = max(self.minimum, self.limit * self.decrease)
+
+class SlidingWindowRateLimiter:
+    """Client-side rate limiter over one or more sliding windows
+    
+    `limits` is a sequence of (max_requests, window_seconds) pairs; acquire()
+    waits until a request fits in every window, then records it.
+    """
+    
+    def __init__(self, limits):
+        self._windows = [(max_requests, window, deque()) for max_requests, window in limits]
+    
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            wait = 0.0
+            for max_requests, window, timestamps in self._windows:
+                while timestamps and now - timestamps[0] >= window:
+                    timestamps.popleft()
+                if len(timestamps) >= max_requests:
+                    wait = max(wait, timestamps[0] + window - now)
+            if wait <= 0:
+                for _, _, timestamps in self._windows:
+                    timestamps.append(now)
+                return
+            await asyncio.sleep(wait)
+
 class RealResearchEngine:
     """Real research engine that performs actual web scraping and company research"""
     
@@ -47,16 +600,370 @@ class RealResearchEngine:
         self.openai_key = os.getenv("OPENAI_API_KEY")
         self.claude_key = os.getenv("CLAUDE_API_KEY")
         
-        # Initialize AI clients
-        if OPENAI_AVAILABLE and self.openai_key:
-            self.openai_client = AsyncOpenAI(api_key=self.openai_key)
+        # AI clients and their shared keep-alive pool are bound to the running
+        # event loop on first use (see _bind_to_running_loop / _create_llm_clients)
+        self._llm_http_client: Optional["httpx.AsyncClient"] = None
+        self._llm_clients: Dict[str, Any] = {}
+        
+        # Proactive limit on Google Custom Search requests to avoid 429s
+        self._search_rate_limiter = SlidingWindowRateLimiter(GOOGLE_RATE_LIMITS)
+        
+        # Per-provider request shaping so concurrent LLM calls stay under RPM limits
+        self._llm_rate_limiters = {
+            "openai": SlidingWindowRateLimiter(((OPENAI_REQUESTS_PER_MINUTE, 60.0),)),
+            "claude": SlidingWindowRateLimiter(((CLAUDE_REQUESTS_PER_MINUTE, 60.0),)),
+        }
+        
+        # Moving average of outreach call latency (seconds) per LLM provider;
+        # failed calls count as LLM_FAILURE_LATENCY_SECONDS
+        self._llm_latency_ewma = {"openai": LLM_LATENCY_INITIAL_SECONDS, "claude": LLM_LATENCY_INITIAL_SECONDS}
+        
+        # LRU cache of scraped contacts: key -> (scraped_at, contacts)
+        self._contact_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        
+        # On-disk TTL cache of Google search, targeting-extraction and LLM responses
+        self._response_cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._response_cache = diskcache.Cache(RESPONSE_CACHE_DIR)
+            except Exception as e:
+                logger.warning(f"⚠️ Response cache disabled ({RESPONSE_CACHE_DIR}): {e}")
+        
+        # Shared HTTP session and concurrency limits, bound to the running event
+        # loop on first use (see _bind_to_running_loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._http_semaphore: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._search_limiter: Optional["AdaptiveConcurrencyLimiter"] = None
+        
+        # Website fetches currently in progress, keyed by URL, so concurrent
+        # callers share one download instead of issuing duplicate GETs
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+        
+        # Single-company analyses waiting to be sent together (see _analyze_company_with_ai)
+        self._analysis_queue: List[Tuple[Dict[str, Any], "asyncio.Future"]] = []
+        self._analysis_flush: Optional[asyncio.TimerHandle] = None
+        self._background_tasks: set = set()
+    
+    def _bind_to_running_loop(self):
+        """(Re)create loop-bound resources when called from a new event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            stale_loop, self._loop = self._loop, loop
+            stale_clients = (self._session, self._llm_http_client, self._llm_clients)
+            self._session = None
+            self._inflight = {}
+            self._analysis_queue = []
+            self._analysis_flush = None
+            self._background_tasks = set()
+            self._http_semaphore = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+            self._llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+            self._search_limiter = AdaptiveConcurrencyLimiter(
+                initial=GOOGLE_SEARCH_CONCURRENCY, maximum=GOOGLE_SEARCH_MAX_CONCURRENCY
+            )
+            self._llm_http_client, self._llm_clients = self._create_llm_clients()
+            if stale_loop is not None:
+                self._release_stale_clients(stale_loop, *stale_clients)
+    
+    def _release_stale_clients(self, stale_loop: asyncio.AbstractEventLoop, session, http_client, llm_clients):
+        """Close the session and AI clients left behind on an earlier event loop
+        
+        The close runs on the loop that owns their sockets when it is still alive;
+        a session whose loop is already closed is detached instead.
+        """
+        if stale_loop.is_closed():
+            # Its event loop is already closed and took the sockets with it
+            if session is not None and not session.closed:
+                session.detach()
+            return
+        closing = self._close_http_clients(session, http_client, llm_clients)
+        if stale_loop.is_running():
+            asyncio.run_coroutine_threadsafe(closing, stale_loop)
         else:
-            self.openai_client = None
-            
-        if CLAUDE_AVAILABLE and self.claude_key:
-            self.claude_client = anthropic.AsyncAnthropic(api_key=self.claude_key)
+            task = self._loop.create_task(closing)
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    @staticmethod
+    async def _close_http_clients(session, http_client, llm_clients):
+        """Close an aiohttp session and the LLM connection pool (or each AI client's own pool)"""
+        closers = []
+        if session is not None and not session.closed:
+            closers.append(session.close())
+        if http_client is not None:
+            if not http_client.is_closed:
+                closers.append(http_client.aclose())
         else:
-            self.claude_client = None
+            closers.extend(client.close() for client in llm_clients.values() if client is not None)
+        results = await asyncio.gather(*closers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Error closing HTTP client: {result}")
+    
+    def _create_llm_clients(self) -> Tuple[Optional["httpx.AsyncClient"], Dict[str, Any]]:
+        """AI clients for the running event loop, sharing one keep-alive pool (HTTP/2 when h2 is installed)"""
+        http_client = None
+        if HTTPX_AVAILABLE and (OPENAI_AVAILABLE or CLAUDE_AVAILABLE):
+            http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE
+                ),
+                timeout=httpx.Timeout(LLM_HTTP_TIMEOUT_SECONDS, connect=5.0)
+            )
+        
+        clients: Dict[str, Any] = {"openai": None, "claude": None, "extraction": None}
+        if OPENAI_AVAILABLE and self.openai_key:
+            clients["openai"] = AsyncOpenAI(api_key=self.openai_key, http_client=http_client)
+        if CLAUDE_AVAILABLE and self.claude_key:
+            clients["claude"] = anthropic.AsyncAnthropic(api_key=self.claude_key, http_client=http_client)
+        if OPENAI_AVAILABLE and EXTRACTION_BASE_URL:
+            clients["extraction"] = AsyncOpenAI(
+                base_url=EXTRACTION_BASE_URL,
+                api_key=os.getenv("EXTRACTION_API_KEY", "local"),
+                http_client=http_client
+            )
+        return http_client, clients
+    
+    @property
+    def openai_client(self):
+        self._bind_to_running_loop()
+        return self._llm_clients["openai"]
+    
+    @property
+    def claude_client(self):
+        self._bind_to_running_loop()
+        return self._llm_clients["claude"]
+    
+    @property
+    def extraction_client(self):
+        self._bind_to_running_loop()
+        return self._llm_clients["extraction"]
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on first use
+        
+        Reusing one session keeps TCP/TLS connections and DNS lookups pooled
+        across all Google searches and website fetches.
+        """
+        self._bind_to_running_loop()
+        if self._session is None or self._session.closed:
+            # Cap per-host connections so one slow site cannot take the whole pool
+            connector = aiohttp.TCPConnector(
+                limit=100, limit_per_host=10, use_dns_cache=True, ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=GOOGLE_TIMEOUT)
+        return self._session
+    
+    async def warm_up(self):
+        """Open pooled TLS connections to the LLM APIs before the first real request
+        
+        An unauthenticated HEAD is enough to complete the handshake; the status is ignored.
+        """
+        self._bind_to_running_loop()
+        if self._llm_http_client is None:
+            return
+        base_urls = {
+            str(client.base_url)
+            for client in (self.openai_client, self.claude_client, self.extraction_client)
+            if client is not None
+        }
+        results = await asyncio.gather(
+            *(self._llm_http_client.head(url) for url in base_urls),
+            return_exceptions=True
+        )
+        for url, result in zip(base_urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Could not prewarm connection to {url}: {result}")
+    
+    async def aclose(self):
+        """Release network and cache resources; call once on application shutdown
+        
+        Closes the shared aiohttp session and LLM connection pool (or each AI
+        client's own pool when httpx is missing), cancels queued analyses and
+        closes the disk cache. Safe to call more than once.
+        """
+        if self._analysis_flush is not None:
+            self._analysis_flush.cancel()
+            self._analysis_flush = None
+        for _, future in self._analysis_queue:
+            future.cancel()
+        self._analysis_queue = []
+        for task in list(self._background_tasks):
+            task.cancel()
+        
+        session, http_client, llm_clients = self._session, self._llm_http_client, self._llm_clients
+        self._session = None
+        self._llm_http_client = None
+        self._llm_clients = {}
+        # The next call from any loop builds fresh sessions and clients
+        self._loop = None
+        await self._close_http_clients(session, http_client, llm_clients)
+        
+        if self._response_cache is not None:
+            self._response_cache.close()
+    
+    @staticmethod
+    def _response_cache_key(kind: str, *parts: Any) -> str:
+        digest = hashlib.blake2b(_json_dumps(parts).encode(), digest_size=16).hexdigest()
+        return f"{kind}:{digest}"
+    
+    def _get_cached_response(self, key: str) -> Optional[Any]:
+        if self._response_cache is None:
+            return None
+        try:
+            return self._response_cache.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Response cache read failed: {e}")
+            return None
+    
+    def _cache_response(self, key: str, value: Any, expire: int = RESPONSE_CACHE_TTL_SECONDS):
+        if self._response_cache is None:
+            return
+        try:
+            self._response_cache.set(key, value, expire=expire)
+        except Exception as e:
+            logger.warning(f"⚠️ Response cache write failed: {e}")
+    
+    def _http_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent outbound HTTP requests"""
+        self._bind_to_running_loop()
+        return self._http_semaphore
+    
+    @staticmethod
+    def _is_overload_error(error: Exception) -> bool:
+        status = getattr(error, "status_code", None) or getattr(error, "status", None)
+        return status in OVERLOAD_STATUS_CODES
+    
+    @staticmethod
+    def _retry_after_seconds(retry_after: Optional[str], attempt: int) -> float:
+        """Delay before retrying: the Retry-After header if numeric, else exponential backoff"""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = 2 ** attempt
+        return delay + random.uniform(0, 1)
+    
+    async def _call_llm(self, provider: str, request):
+        """Run an LLM request under the provider's rate limit and the concurrency ceiling
+        
+        Rate-limit/overload errors (429, 503, 529) are retried after the
+        Retry-After header or exponential backoff with jitter; any other error
+        is raised to the caller.
+        """
+        self._bind_to_running_loop()
+        rate_limiter = self._llm_rate_limiters[provider]
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            await rate_limiter.acquire()
+            async with self._llm_semaphore:
+                try:
+                    return await request()
+                except Exception as e:
+                    if attempt >= LLM_MAX_RETRIES or not self._is_overload_error(e):
+                        raise
+                    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+                    retry_after = headers.get("retry-after")
+            delay = self._retry_after_seconds(retry_after, attempt)
+            logger.warning(f"⏳ LLM API overloaded, retrying in {delay:.1f}s (attempt {attempt + 1}/{LLM_MAX_RETRIES})")
+            await asyncio.sleep(delay)
+    
+    def _record_llm_latency(self, provider: str, seconds: float):
+        previous = self._llm_latency_ewma[provider]
+        self._llm_latency_ewma[provider] = previous + LLM_LATENCY_EWMA_ALPHA * (seconds - previous)
+    
+    def _providers_by_latency(self) -> List[str]:
+        """Configured LLM providers, fastest recent average first (OpenAI on ties)"""
+        providers = [
+            provider for provider, client in (("openai", self.openai_client), ("claude", self.claude_client))
+            if client is not None
+        ]
+        return sorted(providers, key=lambda provider: self._llm_latency_ewma[provider])
+    
+    async def _complete_outreach_json(self, system_prompt: str, prompt: str, claude_max_tokens: int) -> Any:
+        """Run an outreach prompt on the fastest provider, failing over to the other on error
+        
+        Each attempt updates the provider's latency average, so a provider that
+        keeps failing falls behind the other one for later calls.
+        """
+        last_error: Optional[Exception] = None
+        for provider in self._providers_by_latency():
+            started = time.monotonic()
+            try:
+                result = await self._request_outreach_json(provider, system_prompt, prompt, claude_max_tokens)
+            except Exception as e:
+                logger.warning(f"⚠️ {provider} outreach call failed: {e}")
+                self._record_llm_latency(provider, max(time.monotonic() - started, LLM_FAILURE_LATENCY_SECONDS))
+                last_error = e
+            else:
+                self._record_llm_latency(provider, time.monotonic() - started)
+                return result
+        raise last_error or RuntimeError("No AI client configured")
+    
+    async def _request_outreach_json(self, provider: str, system_prompt: str, prompt: str,
+                                     claude_max_tokens: int) -> Any:
+        if provider == "openai":
+            response = await self._call_llm("openai", lambda: self.openai_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            ))
+            return _json_loads(response.choices[0].message.content)
+        response = await self._call_llm("claude", lambda: self.claude_client.messages.create(
+            model="claude-3-5-sonnet-20241022",
+            max_tokens=claude_max_tokens,
+            system=system_prompt,
+            messages=[
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": "{"}
+            ]
+        ))
+        # The reply continues the prefilled "{", so it is always a JSON object
+        return _json_loads("{" + response.content[0].text)
+    
+    def _parse_trivial_prompt(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Deterministically parse short "<keywords> companies in <Location>" prompts
+        
+        Returns None unless an industry, a location and FAST_PATH_MIN_KEYWORDS
+        keywords are all recognized and every other word is a known keyword or
+        stopword, so anything ambiguous (roles, company sizes) still goes to the LLM.
+        """
+        words = prompt.split()
+        if not words or len(words) > FAST_PATH_MAX_WORDS:
+            return None
+        if _RE_FAST_EXCLUDED.search(prompt):
+            return None
+        
+        location_match = _RE_FAST_LOCATION.search(prompt)
+        if not location_match:
+            return None
+        location = location_match.group(1).strip(" .,")
+        
+        industry = None
+        keywords = []
+        for word in (prompt[:location_match.start()] + prompt[location_match.end():]).split():
+            word = word.strip(" .,;:!?")
+            lowered = word.lower()
+            if not word or lowered in FAST_PATH_STOPWORDS:
+                continue
+            if lowered not in FAST_PATH_INDUSTRIES and lowered not in FAST_PATH_KEYWORDS:
+                return None
+            industry = industry or FAST_PATH_INDUSTRIES.get(lowered)
+            keywords.append(word)
+        
+        if not industry or len(keywords) < FAST_PATH_MIN_KEYWORDS:
+            return None
+        return {
+            "keywords": keywords,
+            "industry": industry,
+            "location": location,
+            "search_queries": []
+        }
     
     async def extract_targeting_criteria(self, prompt: str) -> Dict[str, Any]:
         """Extract structured targeting criteria from user prompt using AI
@@ -67,7 +974,7 @@ class RealResearchEngine:
         - What criteria make a good lead
         - How to exclude certain companies
         """
-        if not self.openai_client and not self.claude_client:
+        if not self.openai_client and not self.claude_client and not self.extraction_client:
             logger.error("❌ NO AI CLIENT AVAILABLE (OpenAI/Claude API key not set)")
             logger.error("Using rule-based extraction fallback")
             logger.error("⚠️ Results will be lower quality without AI")
@@ -124,6 +1031,19 @@ class RealResearchEngine:
                     "search_queries": [f"{' '.join(prompt.split()[:5])} companies"]
                 }
         
+        # Short prompts are parsed before the cache lookup, which they do not need
+        fast_criteria = self._parse_trivial_prompt(prompt)
+        if fast_criteria is not None:
+            logger.info(f"⚡ Parsed targeting criteria without AI: {fast_criteria}")
+            return fast_criteria
+        
+        cache_key = self._response_cache_key("criteria", prompt)
+        # Every disk cache read unpickles a fresh dict, so callers may annotate it
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("♻️ Using cached targeting criteria")
+            return cached
+        
         extraction_prompt = f"""
         You are analyzing a lead generation request. The user has provided a prompt that may include:
         1. A short instruction like "Generate leads as explained in the knowledge base"
@@ -216,32 +1136,51 @@ class RealResearchEngine:
         """
         
         try:
-            if self.openai_client:
-                response = await self.openai_client.chat.completions.create(
+            result = None
+            if self.extraction_client:
+                try:
+                    response = await self.extraction_client.chat.completions.create(
+                        model=EXTRACTION_MODEL,
+                        messages=[{"role": "user", "content": extraction_prompt}],
+                        temperature=0.3,
+                        response_format={"type": "json_object"}
+                    )
+                    result = _json_loads(response.choices[0].message.content)
+                except Exception as e:
+                    logger.warning(f"⚠️ Local extraction model failed, falling back to hosted API: {e}")
+            
+            if result is None and self.openai_client:
+                response = await self._call_llm("openai", lambda: self.openai_client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": extraction_prompt}],
                     temperature=0.3,
                     response_format={"type": "json_object"}
-                )
-                result = json.loads(response.choices[0].message.content)
-            elif self.claude_client:
-                response = await self.claude_client.messages.create(
+                ))
+                result = _json_loads(response.choices[0].message.content)
+            elif result is None and self.claude_client:
+                response = await self._call_llm("claude", lambda: self.claude_client.messages.create(
                     model="claude-3-5-sonnet-20241022",
                     max_tokens=2000,
-                    messages=[{"role": "user", "content": extraction_prompt}]
-                )
-                result = json.loads(response.content[0].text)
+                    messages=[
+                        {"role": "user", "content": extraction_prompt},
+                        {"role": "assistant", "content": "{"}
+                    ]
+                ))
+                # The reply continues the prefilled "{", so it is always a JSON object
+                result = _json_loads("{" + response.content[0].text)
+            
+            if result is None:
+                raise RuntimeError("Local extraction model failed and no hosted AI client is configured")
             
             logger.info(f"✅ Extracted targeting criteria from research guide:")
             logger.info(f"   Keywords: {result.get('keywords', [])}")
             logger.info(f"   Industry: {result.get('industry', 'N/A')}")
             logger.info(f"   Generated search queries: {len(result.get('search_queries', []))}")
+            self._cache_response(cache_key, result)
             return result
             
         except Exception as e:
-            logger.error(f"Error extracting targeting criteria: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error extracting targeting criteria: %s", e)
             return {"keywords": prompt.split()[:10], "industry": "Technology", "search_queries": []}
     
     async def search_companies(self, criteria: Dict[str, Any], target_count: int) -> List[Dict[str, Any]]:
@@ -263,8 +1202,6 @@ class RealResearchEngine:
             logger.info(f"="*80)
             return []
         
-        companies = []
-        
         # Extract structured data from criteria
         keywords = criteria.get("keywords", [])
         industry = criteria.get("industry", "")
@@ -281,90 +1218,22 @@ class RealResearchEngine:
         logger.info(f"  Exclude: {exclude_keywords}")
         logger.info(f"  Original Prompt: {original_prompt[:100]}...")  # NEW: Log prompt
         
-        # Build SMART search queries using ALL parameters
-        search_queries = []
+        # Query permutations are memoized per criteria, so retries and later stages
+        # that replay the same criteria skip rebuilding them
+        ai_queries = _as_query_terms(criteria.get("search_queries"))
+        queries, fallback = _build_search_queries(
+            _as_query_terms(keywords), _as_query_text(industry), _as_query_text(location),
+            _as_query_text(company_size), _as_query_text(original_prompt),
+            ai_queries, _as_query_terms(criteria.get("custom_queries")),
+        )
+        search_queries = list(queries)
         
-        # PRIORITY 1: Use AI-generated search queries from research guide analysis (MOST SPECIFIC)
-        ai_queries = criteria.get("search_queries", [])
         if ai_queries:
             logger.info(f"✅ PRIORITY 1: Using {len(ai_queries)} AI-generated search queries from research guide")
-            search_queries.extend(ai_queries)
-        
-        # PRIORITY 2: Build complementary queries from structured fields (AS FALLBACK/SUPPLEMENT)
-        # Only add these if we don't have enough AI queries
-        if len(search_queries) < 10:
-            # 1. Highly targeted queries combining all parameters
-            if industry and location and keywords:
-                # "Technology companies in San Francisco AI SaaS"
-                search_queries.append(f"{industry} companies in {location} {' '.join(keywords[:2])}")
-                # "San Francisco Technology startups AI machine learning"
-                search_queries.append(f"{location} {industry} startups {' '.join(keywords[:3])}")
-            
-            # 2. Industry + location specific
-            if industry and location:
-                search_queries.append(f"{industry} companies {location}")
-                search_queries.append(f"top {industry} businesses {location}")
-                search_queries.append(f"{industry} startups {location}")
-            
-            # 3. Keyword-focused with location
-            if keywords and location:
-                for keyword in keywords[:3]:
-                    search_queries.append(f"{keyword} companies {location}")
-                    search_queries.append(f"{keyword} startups {location}")
-            
-            # 4. Industry + keyword combinations
-            if industry and keywords:
-                for keyword in keywords[:3]:
-                    search_queries.append(f"{industry} {keyword} companies")
-            
-            # 5. Company size specific searches
-            if company_size and industry and location:
-                size_term = "startups" if "Startup" in company_size else "companies"
-                search_queries.append(f"{company_size.split('(')[0].strip()} {industry} {size_term} {location}")
-            
-            # 6. Pure keyword searches (broader)
-            for keyword in keywords[:2]:
-                search_queries.append(f"{keyword} company directory")
-                search_queries.append(f"best {keyword} companies")
-        
-        # PRIORITY 3: Fallback to keywords if still no queries
-        if len(search_queries) == 0 and keywords:
+        if fallback == "keywords":
             logger.warning(f"⚠️ No AI queries or structured fields, using extracted keywords")
-            for keyword in keywords[:5]:
-                search_queries.append(f"{keyword} companies")
-                search_queries.append(f"{keyword} startups")
-        
-        # PRIORITY 4: Last resort - use original prompt
-        if len(search_queries) == 0 and original_prompt:
+        elif fallback == "prompt":
             logger.warning(f"⚠️ No queries generated, falling back to original prompt")
-            search_queries.append(original_prompt)
-            # Extract words from prompt as additional queries
-            prompt_words = [w for w in original_prompt.split() if len(w) > 4][:5]
-            for word in prompt_words:
-                search_queries.append(f"{word} companies")
-
-        custom_queries = criteria.get("custom_queries") or []
-        if custom_queries:
-            search_queries.extend(q for q in custom_queries if q)
-
-        core_queries = [
-            "institutional build-to-rent investors Sunbelt",
-            "opportunity zone multifamily capital partner",
-            "limited partner multifamily equity Phoenix",
-            "Sunbelt multifamily fund manager",
-            "qualified opportunity fund multifamily investor",
-        ]
-        for core_query in core_queries:
-            if core_query not in search_queries:
-                search_queries.append(core_query)
-
-        seen_queries = set()
-        deduped_queries = []
-        for query in search_queries:
-            if query not in seen_queries:
-                seen_queries.add(query)
-                deduped_queries.append(query)
-        search_queries = deduped_queries
 
         logger.info(f"🔎 Generated {len(search_queries)} targeted search queries:")
         for i, query in enumerate(search_queries[:5], 1):
@@ -382,136 +1251,186 @@ class RealResearchEngine:
         max_queries = min(len(search_queries), 10)  # Use up to 10 queries (was 3!)
         logger.info(f"📡 Will execute {max_queries} Google searches for comprehensive results")
         
-        async with aiohttp.ClientSession() as session:
-            for i, query in enumerate(search_queries[:max_queries], 1):
+        session = self._get_session()
+        # Run the searches concurrently; the adaptive limiter replaces the fixed 1s
+        # delay between searches to stay within Google's QPS limits
+        async def run_search(i: int, query: str) -> List[Dict[str, Any]]:
+            async with self._search_limiter:
+                logger.info(f"🌐 Search {i}/{max_queries}: \"{query}\"")
+                companies_found = await self._search_google(session, query, target_count)
+                logger.info(f"  ✅ Found {len(companies_found)} companies from \"{query}\"")
+                return companies_found
+        
+        queries_to_run = search_queries[:max_queries]
+        tasks = [
+            asyncio.create_task(run_search(i, query))
+            for i, query in enumerate(queries_to_run, 1)
+        ]
+        
+        # Merge in query priority order, keeping the first company seen per domain.
+        # Once the target is reached the remaining searches are cancelled so queued
+        # queries don't spend Google quota on results that would be discarded.
+        # Insertion-ordered, so the first company seen per domain keeps its priority
+        companies_by_domain: Dict[str, Dict[str, Any]] = {}
+        total_found = 0
+        try:
+            for query, task in zip(queries_to_run, tasks):
                 try:
-                    logger.info(f"🌐 Search {i}/{max_queries}: \"{query}\"")
-                    companies_found = await self._search_google(session, query, target_count)
-                    companies.extend(companies_found)
-                    logger.info(f"  ✅ Found {len(companies_found)} companies from this search")
-                    logger.info(f"  📊 Total so far: {len(companies)} companies")
-                    
-                    # Small delay between searches to be respectful to Google API
-                    if i < max_queries:
-                        await asyncio.sleep(1)  # 1 second delay between searches
-                    
-                    # Keep searching until we have enough UNIQUE companies
-                    if len(set(c.get('domain', '') for c in companies)) >= target_count:
-                        logger.info(f"✅ Reached target count of unique companies")
-                        break
-                        
+                    result = await task
                 except Exception as e:
                     logger.error(f"❌ Error searching for '{query}': {e}")
                     continue
-        
-        # Remove duplicates and limit results
-        unique_companies = []
-        seen_domains = set()
-        
-        for company in companies:
-            domain = company.get("domain", "")
-            if domain and domain not in seen_domains:
-                seen_domains.add(domain)
-                unique_companies.append(company)
-                
-                if len(unique_companies) >= target_count:
+                total_found += len(result)
+                for company in result:
+                    domain = company.get("domain", "")
+                    if domain and domain not in companies_by_domain:
+                        companies_by_domain[domain] = company
+                if len(companies_by_domain) >= target_count:
                     break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.info(f"  ⏹️ Cancelled {len(pending)} remaining searches (target reached)")
+                await asyncio.gather(*pending, return_exceptions=True)
+        logger.info(f"  📊 Total: {total_found} companies from {max_queries} searches")
         
+        unique_companies = list(companies_by_domain.values())
         logger.info(f"✅ Found {len(unique_companies)} unique companies (target: {target_count})")
         logger.info(f"Returning {min(len(unique_companies), target_count)} companies")
         logger.info(f"="*80)
         return unique_companies[:target_count]
     
     async def _search_google(self, session, query: str, max_results: int) -> List[Dict[str, Any]]:
-        """Search Google Custom Search API"""
+        """Search Google Custom Search API
+        
+        Job boards are excluded in the search engine itself (JOB_BOARD_SITES added
+        under "Sites to exclude"), not with -site: operators in every query;
+        _is_likely_article_or_blog still drops any that slip through.
+        """
         logger.info(f"🌐 Making Google API request for query: '{query}'")
         
         if not AIOHTTP_AVAILABLE:
             logger.error(f"❌ aiohttp not available, skipping Google search")
             return []
             
-        # Exclude job boards and recruitment sites from results
-        excluded_sites = [
-            "linkedin.com/jobs",
-            "indeed.com",
-            "glassdoor.com",
-            "ziprecruiter.com",
-            "monster.com",
-            "careerbuilder.com",
-            "flexjobs.com",
-            "simplyhired.com",
-            "dice.com",
-            "crunchbase.com/jobs"
-        ]
-        
-        # Add site exclusions to query
-        query_with_exclusions = query
-        for site in excluded_sites[:3]:  # Only use top 3 to keep query reasonable
-            query_with_exclusions += f" -site:{site}"
-        
         url = "https://www.googleapis.com/customsearch/v1"
         params = {
             "key": self.google_api_key,
             "cx": self.google_cse_id,
-            "q": query_with_exclusions,
-            "num": min(max_results, 10)  # Google API limit
+            "q": query,
+            "num": min(max_results, 10),  # Google API limit
+            # Partial response: only the fields we read, not pagemap/metatags per item
+            "fields": "items(title,link,snippet)"
         }
         
         try:
-            logger.info(f"📡 Sending request to: {url}")
-            logger.info(f"Parameters: key=*****, cx={self.google_cse_id[:10]}..., q={query[:50]}...")
+            data = await self._get_google_results(session, url, params, query)
+            if data is None:
+                return []
+            
+            items_count = len(data.get("items", []))
+            logger.info(f"✅ Received {items_count} search results from Google")
             
-            async with session.get(url, params=params) as response:
-                logger.info(f"Response status: {response.status}")
-                
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"❌ Google API error {response.status}: {error_text[:500]}")
-                    return []
-                
-                data = await response.json()
-                items_count = len(data.get("items", []))
-                logger.info(f"✅ Received {items_count} search results from Google")
-                
-                companies = []
-                
-                for item in data.get("items", []):
-                    try:
-                        title = item.get("title", "")
-                        link = item.get("link", "")
-                        domain = self._extract_domain(link)
-                        
-                        # Filter out non-company results
-                        filter_result = self._is_likely_article_or_blog(title, link, domain)
-                        if filter_result:
-                            logger.warning(f"  🚫 FILTERED OUT (reason: {filter_result}): {title[:80]}")
-                            logger.warning(f"     Domain: {domain}, URL: {link[:80]}")
-                            continue
-                        
-                        extracted_name = self._extract_company_name(title)
-                        if not self._looks_like_company_name(extracted_name):
-                            logger.warning(f"  🚫 FILTERED OUT (reason: suspicious company name): {extracted_name[:80]}")
-                            continue
-
-                        company = {
-                            "name": extracted_name,
-                            "website": link,
-                            "description": item.get("snippet", ""),
-                            "domain": domain,
-                            "source": "Google Search",
-                            "search_query": query
-                        }
-                        companies.append(company)
-                        logger.info(f"  ✅ Added company: {company['name']} ({domain})")
-                    except Exception as e:
-                        logger.error(f"Error processing search result: {e}")
+            companies = []
+            
+            for item in data.get("items", []):
+                try:
+                    title = item.get("title", "")
+                    link = item.get("link", "")
+                    domain = self._extract_domain(link)
+                    
+                    # Filter out non-company results
+                    filter_result = self._is_likely_article_or_blog(title, link, domain)
+                    if filter_result:
+                        logger.warning(f"  🚫 FILTERED OUT (reason: {filter_result}): {title[:80]}")
+                        logger.warning(f"     Domain: {domain}, URL: {link[:80]}")
+                        continue
+                    
+                    extracted_name = self._extract_company_name(title)
+                    if not self._looks_like_company_name(extracted_name):
+                        logger.warning(f"  🚫 FILTERED OUT (reason: suspicious company name): {extracted_name[:80]}")
                         continue
-                
-                return companies
+
+                    company = {
+                        "name": extracted_name,
+                        "website": link,
+                        "description": item.get("snippet", ""),
+                        "domain": domain,
+                        "source": "Google Search",
+                        "search_query": query
+                    }
+                    companies.append(company)
+                    logger.info(f"  ✅ Added company: {company['name']} ({domain})")
+                except Exception as e:
+                    logger.error(f"Error processing search result: {e}")
+                    continue
+            
+            return companies
         except Exception as e:
             logger.error(f"Error searching Google: {e}")
             return []
     
+    async def _get_google_results(self, session, url: str, params: Dict[str, Any],
+                                  query: str) -> Optional[Dict[str, Any]]:
+        """Google response for a query from the disk cache or the API
+        
+        Concurrent misses for the same query share one API call.
+        """
+        cache_key = self._response_cache_key("google", params["cx"], params["q"], params["num"])
+        data = self._get_cached_response(cache_key)
+        if data is not None:
+            logger.info(f"♻️ Using cached Google results for query: '{query}'")
+            return data
+        
+        self._bind_to_running_loop()
+        if cache_key in self._inflight:
+            return await asyncio.shield(self._inflight[cache_key])
+        
+        future = self._loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            data = await self._fetch_google_results(session, url, params, query)
+        finally:
+            future.set_result(data)
+            self._inflight.pop(cache_key, None)
+        if data is not None:
+            self._cache_response(cache_key, data, expire=GOOGLE_CACHE_TTL_SECONDS)
+        return data
+    
+    async def _fetch_google_results(self, session, url: str, params: Dict[str, Any], query: str) -> Optional[Dict[str, Any]]:
+        """Call the Custom Search API, retrying rate-limited responses; None on error"""
+        logger.info(f"📡 Sending request to: {url}")
+        logger.info(f"Parameters: key=*****, cx={self.google_cse_id[:10]}..., q={query[:50]}...")
+        
+        data = None
+        for attempt in range(GOOGLE_MAX_RETRIES + 1):
+            retry_delay = None
+            await self._search_rate_limiter.acquire()
+            async with self._http_limit():
+                async with session.get(url, params=params) as response:
+                    logger.info(f"Response status: {response.status}")
+                    
+                    if response.status in OVERLOAD_STATUS_CODES and attempt < GOOGLE_MAX_RETRIES:
+                        retry_delay = self._retry_after_seconds(response.headers.get("Retry-After"), attempt)
+                    elif response.status != 200:
+                        error_text = await response.text()
+                        logger.error(f"❌ Google API error {response.status}: {error_text[:500]}")
+                        return None
+                    else:
+                        data = await response.json()
+            
+            if retry_delay is None:
+                break
+            # Back off outside the HTTP semaphore and shrink search concurrency
+            self._search_limiter.on_overload()
+            logger.warning(f"⏳ Google API rate limited, retrying in {retry_delay:.1f}s (attempt {attempt + 1}/{GOOGLE_MAX_RETRIES})")
+            await asyncio.sleep(retry_delay)
+        
+        self._search_limiter.on_success()
+        return data
+    
     def _is_known_non_company_domain(self, domain: str) -> Optional[str]:
         if not domain:
             return "Missing domain"
@@ -598,30 +1517,8 @@ class RealResearchEngine:
         if domain_reason:
             return domain_reason
 
-        article_patterns = [
-            (r'\?', "Contains question mark (article)"),
-            (r'\bhow\s+to\b', "How-to guide"),
-            (r'\btop\s+\d+', "Top N list article"),
-            (r'\bbest\s+\d+', "Best of list article"),
-            (r'\bguide\b', "Guide article"),
-            (r'\btips\b', "Tips article"),
-            (r'\bwhy\s+', "Why question article"),
-            (r'\bwhat\s+', "What question article"),
-            (r'\bfind\s+', "Find X article"),
-            (r'\bultimate\b', "Ultimate guide"),
-            (r'\bcomplete\b', "Complete guide"),
-            (r'\bbeginner', "Beginner guide"),
-            (r'\bcourse\b', "Course/tutorial"),
-            (r'\blesson\b', "Lesson/tutorial"),
-            (r'\btutorial\b', "Tutorial"),
-            (r'\bopportunit', "Opportunity article"),
-            (r'\bpotential\b', "Opportunity article"),
-            (r'\beconomic\b', "Economic analysis article"),
-            (r'technology\s+leads', "Technology leads article"),
-        ]
-
-        for pattern, reason in article_patterns:
-            if re.search(pattern, title_lower):
+        for pattern, reason in ARTICLE_TITLE_PATTERNS:
+            if pattern.search(title_lower):
                 return reason
 
         article_url_patterns = [
@@ -645,7 +1542,10 @@ class RealResearchEngine:
             if pattern in url_lower:
                 return reason
 
-        if re.search(r'/20\d{2}/\d{2}/\d{2}/', url_lower):
+        if _is_job_board_url(url):
+            return "Job board result"
+
+        if _RE_DATED_URL.search(url_lower):
             return "Dated article URL"
 
         article_domains = [
@@ -723,7 +1623,7 @@ class RealResearchEngine:
         ]):
             return False
 
-        parts = [p for p in re.split(r"\s+", name) if p]
+        parts = name.split()
         if len(parts) > 6 or len(parts) < 1:
             return False
 
@@ -731,63 +1631,166 @@ class RealResearchEngine:
     
     def _extract_company_name(self, title: str) -> str:
         """Extract company name from search result title"""
-        # Remove common suffixes and clean up
-        title = re.sub(r'\s*-\s*.*$', '', title)  # Remove everything after dash
-        title = re.sub(r'\s*\|\s*.*$', '', title)  # Remove everything after pipe
-        title = re.sub(r'\s*:.*$', '', title)  # Remove everything after colon
-        return title.strip()
+        return _extract_company_name(title)
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except:
-            return ""
+        return _extract_domain(url)
     
     async def research_company_deep(self, company: Dict[str, Any]) -> Dict[str, Any]:
         """Conduct deep research on a company using AI and web scraping"""
-        logger.info(f"Researching company: {company.get('name')}")
-        
-        # Gather research data
-        research_data = {
-            "company": company,
-            "website_content": await self._scrape_website(company.get("website", "")),
-            "news_mentions": await self._search_company_news(company.get("name", "")),
-            "social_signals": await self._get_social_signals(company.get("name", "")),
-            "technology_stack": await self._analyze_tech_stack(company.get("website", "")),
-            "funding_info": await self._get_funding_info(company.get("name", ""))
-        }
+        research_data = await self._gather_research_data(company)
         
         # Analyze with AI
         analysis = await self._analyze_company_with_ai(research_data)
+        return self._apply_research(company, analysis)
+    
+    async def research_companies_deep(self, companies: List[Dict[str, Any]],
+                                      concurrency: int = RESEARCH_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Research several companies at once, returned in the same order
+        
+        Up to `concurrency` companies are scraped in parallel, then all of them are
+        analyzed through analyze_companies_batch (one LLM call per batch).
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def gather_one(company: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._gather_research_data(company)
+        
+        research_data_list = await asyncio.gather(*(gather_one(company) for company in companies))
+        analyses = await self.analyze_companies_batch(research_data_list)
+        return [self._apply_research(company, analysis) for company, analysis in zip(companies, analyses)]
+    
+    async def _gather_research_data(self, company: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect website, news, social and funding data for a company"""
+        logger.info(f"Researching company: {company.get('name')}")
+        
+        company_name = company.get("name", "")
         
-        # Combine original company data with research
+        # The sub-fetches are independent, so run them concurrently. The website
+        # is fetched once and the tech stack is detected from the same HTML.
+        website_data, news_mentions, social_signals, funding_info = await asyncio.gather(
+            self._fetch_website_data(company.get("website", "")),
+            self._search_company_news(company_name),
+            self._get_social_signals(company_name),
+            self._get_funding_info(company_name),
+            return_exceptions=True
+        )
+        
+        # A failed source only drops that part of the research
+        if isinstance(website_data, Exception):
+            logger.error(f"Error scraping website for {company_name}: {website_data}")
+            website_data = ("", [])
+        website_content, technology_stack = website_data
+        if isinstance(news_mentions, Exception):
+            logger.error(f"Error searching news for {company_name}: {news_mentions}")
+            news_mentions = []
+        if isinstance(social_signals, Exception):
+            logger.error(f"Error getting social signals for {company_name}: {social_signals}")
+            social_signals = {}
+        if isinstance(funding_info, Exception):
+            logger.error(f"Error getting funding info for {company_name}: {funding_info}")
+            funding_info = {}
+        
+        return {
+            "company": company,
+            "website_content": website_content,
+            "news_mentions": news_mentions,
+            "social_signals": social_signals,
+            "technology_stack": technology_stack,
+            "funding_info": funding_info
+        }
+    
+    def _apply_research(self, company: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine original company data with its AI analysis"""
         company.update(analysis)
-        company["research_completed_at"] = datetime.utcnow().isoformat()
+        company["outreach_summary"] = self._summarize_research(analysis)
+        company["research_completed_at"] = _utc_now_iso()
         
         return company
     
-    async def _scrape_website(self, url: str) -> str:
-        """Scrape company website content"""
-        if not url or not AIOHTTP_AVAILABLE:
+    def _is_fetchable_url(self, url: Optional[str]) -> bool:
+        """Cheap check that a website field is an absolute http(s) URL worth fetching"""
+        if not url or not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            return False
+        try:
+            return bool(urlparse(url).netloc)
+        except ValueError:
+            return False
+    
+    def _summarize_research(self, research_data: Dict[str, Any]) -> str:
+        """Condense research into a short brief for outreach prompts"""
+        if not research_data or not isinstance(research_data, dict):
             return ""
         
+        parts = []
+        for key, label in (
+            ("pain_points", "Pain points"),
+            ("growth_signals", "Growth signals"),
+            ("reasons_to_reach_out", "Why reach out"),
+        ):
+            items = research_data.get(key)
+            if isinstance(items, list) and items:
+                parts.append(f"{label}: {'; '.join(str(item) for item in items[:2])}")
+        
+        # Unknown research shape: fall back to compact JSON within the same budget
+        summary = " | ".join(parts) if parts else _json_dumps(research_data)
+        return summary[:RESEARCH_SUMMARY_MAX_CHARS]
+    
+    async def _fetch_website_data(self, url: str) -> Tuple[str, List[str]]:
+        """Scrape company website content and detect its tech stack in one fetch
+        
+        Concurrent calls for the same URL await the fetch already in flight.
+        """
+        if not AIOHTTP_AVAILABLE or not self._is_fetchable_url(url):
+            return "", []
+        
+        self._bind_to_running_loop()
+        if url in self._inflight:
+            return await asyncio.shield(self._inflight[url])
+        
+        future = self._loop.create_future()
+        self._inflight[url] = future
+        result = ("", [])
+        try:
+            result = await self._fetch_website(url)
+        finally:
+            future.set_result(result)
+            self._inflight.pop(url, None)
+        return result
+    
+    async def _fetch_website(self, url: str) -> Tuple[str, List[str]]:
+        """Download the start of a website's HTML, extract its text and scan it for technologies"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        # Basic text extraction (in production, use proper HTML parsing)
-                        return content[:5000]  # Limit content size
+            session = self._get_session()
+            async with self._http_limit():
+                async with session.get(url, timeout=WEBSITE_TIMEOUT) as response:
+                    if response.status != 200:
+                        return "", []
+                    # PDFs, images and other downloads carry no page text worth reading
+                    if "Content-Type" in response.headers and response.content_type not in HTML_CONTENT_TYPES:
+                        logger.info(f"Skipping non-HTML content ({response.content_type}) at {url}")
+                        return "", []
+                    
+                    # Stream only the start of the page instead of downloading all of it
+                    chunks = []
+                    total = 0
+                    async for chunk in response.content.iter_chunked(16384):
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if total >= WEBSITE_MAX_BYTES:
+                            break
+                    raw = b"".join(chunks)[:WEBSITE_MAX_BYTES]
+                    content = raw.decode(response.charset or "utf-8", errors="ignore")
+            
+            # Parsing is CPU-bound, so it runs in a worker thread (after the connection
+            # and HTTP slot are released) to keep the event loop free for other fetches
+            return await asyncio.to_thread(self._parse_website, content)
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
         
-        return ""
+        return "", []
     
     async def _search_company_news(self, company_name: str) -> List[Dict[str, Any]]:
         """Search for recent news about the company"""
@@ -797,7 +1800,7 @@ class RealResearchEngine:
             {
                 "title": f"Recent news about {company_name}",
                 "source": "Tech News",
-                "date": datetime.utcnow().isoformat(),
+                "date": _utc_now_iso(),
                 "summary": f"Latest developments at {company_name}"
             }
         ]
@@ -811,27 +1814,24 @@ class RealResearchEngine:
             "engagement_score": 0.5
         }
     
-    async def _analyze_tech_stack(self, website: str) -> List[str]:
-        """Analyze technology stack from website"""
-        if not website or not AIOHTTP_AVAILABLE:
+    def _parse_website(self, html: str) -> Tuple[str, List[str]]:
+        """Visible page text and detected tech stack for downloaded HTML"""
+        # Tech detection scans the raw HTML, where script and asset URLs name the stack
+        return _html_to_text(html), self._analyze_tech_stack_from_html(html)
+    
+    def _analyze_tech_stack_from_html(self, html: str) -> List[str]:
+        """Detect technology stack from already-fetched website HTML"""
+        if not html:
             return []
         
-        # Basic tech stack detection (in production, use proper analysis)
-        tech_indicators = ["React", "Angular", "Vue", "Node.js", "Python", "Java", "AWS", "Azure", "Google Cloud"]
-        detected_tech = []
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(website, timeout=10) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        for tech in tech_indicators:
-                            if tech.lower() in content.lower():
-                                detected_tech.append(tech)
-        except Exception as e:
-            logger.error(f"Error analyzing tech stack for {website}: {e}")
-        
-        return detected_tech
+        # Basic tech stack detection (in production, use proper analysis).
+        # One pass over the HTML, stopping early once every indicator was seen.
+        found = set()
+        for match in _RE_TECH.finditer(html):
+            found.add(match.group(1).lower())
+            if len(found) == len(TECH_INDICATORS):
+                break
+        return [tech for tech in TECH_INDICATORS if tech.lower() in found]
     
     async def _get_funding_info(self, company_name: str) -> Dict[str, Any]:
         """Get funding information for the company"""
@@ -843,64 +1843,236 @@ class RealResearchEngine:
             "valuation": None
         }
     
-    async def _analyze_company_with_ai(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze company research data using AI"""
-        if not self.openai_client and not self.claude_client:
-            return {"analysis": "AI analysis not available"}
-        
+    def _prepare_analysis(self, research_data: Dict[str, Any]) -> Tuple[str, tuple]:
+        """Build the per-company analysis prompt and its cache key"""
         company = research_data["company"]
         website_content = research_data["website_content"]
         
-        analysis_prompt = f"""
-        Analyze this company and provide insights:
+        # A search snippet already summarizes the company, so less page text is needed
+        content_limit = 800 if company.get('description') else 2000
+        website_excerpt = website_content[:content_limit]
         
-        Company: {company.get('name', 'Unknown')}
-        Website: {company.get('website', 'N/A')}
-        Description: {company.get('description', 'N/A')}
-        Website Content: {website_content[:2000]}
+        analysis_prompt = f"""Company: {company.get('name', 'Unknown')}
+Website: {company.get('website', 'N/A')}
+Description: {company.get('description', 'N/A')}
+Website Content: {website_excerpt}"""
         
-        Provide analysis in JSON format:
-        {{
-            "pain_points": ["List of likely pain points"],
-            "growth_signals": ["Signs of growth or expansion"],
-            "technology_needs": ["Technology needs or gaps"],
-            "buying_triggers": ["What might trigger a purchase"],
-            "key_decision_makers": ["Types of decision makers to target"],
-            "reasons_to_reach_out": ["Why this company is a good prospect"],
-            "industry_insights": ["Industry-specific insights"],
-            "competitive_landscape": ["Competitive positioning"]
-        }}
+        model_name = ANALYSIS_OPENAI_MODEL if self.openai_client else ANALYSIS_CLAUDE_MODEL
+        content_hash = hashlib.blake2b(
+            website_excerpt.encode("utf-8", errors="ignore"), digest_size=16
+        ).hexdigest()
+        return analysis_prompt, (company.get('name'), content_hash, model_name)
+    
+    def _get_cached_analysis(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        cached = self._get_cached_response(self._response_cache_key("analysis", *cache_key))
+        if cached is None:
+            return None
+        logger.info(f"♻️ Using cached AI analysis for {cache_key[0]}")
+        return cached
+    
+    def _cache_analysis(self, cache_key: tuple, analysis: Dict[str, Any]):
+        # Only successful analyses are cached; failures are retried next time
+        self._cache_response(
+            self._response_cache_key("analysis", *cache_key), analysis, expire=LLM_RESPONSE_CACHE_TTL_SECONDS
+        )
+    
+    async def _analyze_company_with_ai(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze company research data using AI
+        
+        Cache misses are queued briefly: requests arriving within
+        ANALYSIS_BATCH_WINDOW_SECONDS (up to ANALYSIS_BATCH_SIZE) are sent as one
+        analyze_companies_batch call, e.g. when companies are researched concurrently.
         """
+        if not self.openai_client and not self.claude_client:
+            return {"analysis": "AI analysis not available"}
+        
+        _, cache_key = self._prepare_analysis(research_data)
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+        
+        self._bind_to_running_loop()
+        future = self._loop.create_future()
+        self._analysis_queue.append((research_data, future))
+        if len(self._analysis_queue) >= ANALYSIS_BATCH_SIZE:
+            self._flush_analysis_queue()
+        elif self._analysis_flush is None:
+            self._analysis_flush = self._loop.call_later(ANALYSIS_BATCH_WINDOW_SECONDS, self._flush_analysis_queue)
+        return await future
+    
+    def _flush_analysis_queue(self):
+        """Send every queued analysis request as one batch"""
+        if self._analysis_flush is not None:
+            self._analysis_flush.cancel()
+            self._analysis_flush = None
+        queued, self._analysis_queue = self._analysis_queue, []
+        if queued:
+            task = self._loop.create_task(self._run_analysis_batch(queued))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    async def _run_analysis_batch(self, queued: List[Tuple[Dict[str, Any], "asyncio.Future"]]):
+        try:
+            try:
+                if len(queued) == 1:
+                    analyses = [await self._analyze_company_single(queued[0][0])]
+                else:
+                    analyses = await self.analyze_companies_batch([research_data for research_data, _ in queued])
+            except Exception as e:
+                analyses = [{"analysis": "AI analysis failed"} for _ in queued]
+                logger.error(f"Error analyzing queued companies with AI: {e}")
+            for (_, future), analysis in zip(queued, analyses):
+                # A caller that was cancelled no longer waits for its result
+                if not future.done():
+                    future.set_result(analysis)
+        finally:
+            # aclose() cancels this task with CancelledError, which the except
+            # above does not catch; cancel the waiters so none of them hang
+            for _, future in queued:
+                if not future.done():
+                    future.cancel()
+    
+    async def _analyze_company_single(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
+        """One LLM call analyzing a single company"""
+        analysis_prompt, cache_key = self._prepare_analysis(research_data)
+        model_name = cache_key[2]
+        
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             if self.openai_client:
-                response = await self.openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": analysis_prompt}],
-                    temperature=0.3
-                )
-                analysis = json.loads(response.choices[0].message.content)
+                response = await self._call_llm("openai", lambda: self.openai_client.chat.completions.create(
+                    model=model_name,
+                    messages=[
+                        {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": analysis_prompt}
+                    ],
+                    temperature=0.3,
+                    response_format=ANALYSIS_RESPONSE_FORMAT
+                ))
+                analysis = _json_loads(response.choices[0].message.content)
             elif self.claude_client:
-                response = await self.claude_client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
+                response = await self._call_llm("claude", lambda: self.claude_client.messages.create(
+                    model=model_name,
                     max_tokens=1500,
-                    messages=[{"role": "user", "content": analysis_prompt}]
-                )
-                analysis = json.loads(response.content[0].text)
+                    system=ANALYSIS_SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": analysis_prompt},
+                        {"role": "assistant", "content": "{"}
+                    ]
+                ))
+                # The reply continues the prefilled "{", so it is always a JSON object
+                analysis = _json_loads("{" + response.content[0].text)
             
+            self._cache_analysis(cache_key, analysis)
             return analysis
             
         except Exception as e:
             logger.error(f"Error analyzing company with AI: {e}")
             return {"analysis": "AI analysis failed"}
     
-    async def find_company_contacts(self, company: Dict[str, Any], targeting_criteria: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _analysis_batch_response_format(ids) -> Dict[str, Any]:
+        """Structured-output schema for a batch reply: one analysis object per company id"""
+        ids = [str(index) for index in ids]
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "company_analysis_batch",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {index: ANALYSIS_SCHEMA for index in ids},
+                    "required": ids,
+                    "additionalProperties": False,
+                },
+            },
+        }
+    
+    async def analyze_companies_batch(self, research_data_list: List[Dict[str, Any]],
+                                      batch_size: int = ANALYSIS_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Analyze several companies with one LLM call per batch of `batch_size`
+        
+        Takes the same research_data dicts as _analyze_company_with_ai and returns
+        analyses in the same order. Cached companies are not re-sent, and any
+        company missing from a batch reply is analyzed individually.
+        """
+        if not self.openai_client and not self.claude_client:
+            return [{"analysis": "AI analysis not available"} for _ in research_data_list]
+        
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(research_data_list)
+        pending = []  # (index, prompt, cache_key)
+        for index, research_data in enumerate(research_data_list):
+            analysis_prompt, cache_key = self._prepare_analysis(research_data)
+            analyses[index] = self._get_cached_analysis(cache_key)
+            if analyses[index] is None:
+                pending.append((index, analysis_prompt, cache_key))
+        
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            if len(batch) == 1:
+                continue  # Analyzed individually below
+            batch_prompt = "\n\n".join(f"[{index}]\n{prompt}" for index, prompt, _ in batch)
+            model_name = batch[0][2][2]
+            try:
+                if self.openai_client:
+                    response = await self._call_llm("openai", lambda: self.openai_client.chat.completions.create(
+                        model=model_name,
+                        messages=[
+                            {"role": "system", "content": ANALYSIS_BATCH_SYSTEM_PROMPT},
+                            {"role": "user", "content": batch_prompt}
+                        ],
+                        temperature=0.3,
+                        response_format=self._analysis_batch_response_format(index for index, _, _ in batch)
+                    ))
+                    results = _json_loads(response.choices[0].message.content)
+                else:
+                    response = await self._call_llm("claude", lambda: self.claude_client.messages.create(
+                        model=model_name,
+                        max_tokens=min(8192, 1500 * len(batch)),
+                        system=ANALYSIS_BATCH_SYSTEM_PROMPT,
+                        messages=[
+                            {"role": "user", "content": batch_prompt},
+                            {"role": "assistant", "content": "{"}
+                        ]
+                    ))
+                    # The reply continues the prefilled "{", so it is always a JSON object
+                    results = _json_loads("{" + response.content[0].text)
+            except Exception as e:
+                logger.error(f"Error analyzing company batch with AI, falling back to per-company analysis: {e}")
+                continue
+            
+            for index, _, cache_key in batch:
+                analysis = results.get(str(index)) if isinstance(results, dict) else None
+                if isinstance(analysis, dict) and analysis:
+                    self._cache_analysis(cache_key, analysis)
+                    analyses[index] = analysis
+        
+        # Anything not answered by a batch is analyzed on its own, concurrently
+        missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+        if missing:
+            singles = await asyncio.gather(
+                *(self._analyze_company_single(research_data_list[index]) for index in missing)
+            )
+            for index, analysis in zip(missing, singles):
+                analyses[index] = analysis
+        
+        return analyses
+    
+    async def find_company_contacts(self, company: Dict[str, Any], targeting_criteria: Dict[str, Any] = None,
+                                    strict_targeting: bool = True) -> List[Dict[str, Any]]:
         """Find REAL contacts and decision makers for a company using WEB SCRAPING
         
         Args:
             company: Company information (name, domain, etc.)
             targeting_criteria: Optional targeting criteria from research guide
                 - Can specify target_roles, target_titles, target_departments
+            strict_targeting: When target roles are set and nobody matches, return no
+                contacts (the default) so no outreach is spent on off-target leads;
+                False falls back to the unmatched contacts
         """
         company_name = company.get("name", "Unknown Company")
         domain = company.get("domain", "company.com")
@@ -908,10 +2080,7 @@ class RealResearchEngine:
         
         logger.info(f"🔍 Finding REAL contacts for {company_name} at {website}")
         
-        # Import web scraper
-        try:
-            from services.web_scraper import scrape_company_contacts
-        except ImportError:
+        if scrape_company_contacts is None:
             logger.error("❌ Web scraper not available")
             return []
         
@@ -925,35 +2094,64 @@ class RealResearchEngine:
             if target_roles:
                 logger.info(f"🎯 Targeting specific roles from research guide: {target_roles}")
         
-        # Use WEB SCRAPING to find real contacts
+        # Use WEB SCRAPING to find real contacts (cache first, scrape second)
         try:
-            logger.info(f"🌐 Scraping website for contacts: {website}")
-            scraped_contacts = await scrape_company_contacts(
-                company_name=company_name,
-                website=website,
-                target_roles=target_roles
-            )
+            # Contacts are cached per scraped host; a company with neither a website
+            # nor a domain is scraped at a placeholder URL, so it is never cached
+            has_site = bool(company.get("website") or company.get("domain"))
+            cache_host = _extract_domain(website) if has_site and self._is_fetchable_url(website) else ""
+            cache_key = (cache_host, tuple(sorted(target_roles or [])), strict_targeting) if cache_host else None
+            cached = self._contact_cache.get(cache_key) if cache_key else None
+            if cached is not None and time.monotonic() - cached[0] < CONTACT_CACHE_TTL_SECONDS:
+                self._contact_cache.move_to_end(cache_key)
+                logger.info(f"♻️ Using cached contacts for {cache_host}")
+                scraped_contacts = cached[1]
+            else:
+                logger.info(f"🌐 Scraping website for contacts: {website}")
+                scraped_contacts = await scrape_company_contacts(
+                    company_name=company_name,
+                    website=website,
+                    target_roles=target_roles,
+                    strict_targeting=strict_targeting
+                )
+                # Empty results are not cached so transient scrape failures are retried
+                if scraped_contacts and cache_key:
+                    self._contact_cache[cache_key] = (time.monotonic(), scraped_contacts)
+                    self._contact_cache.move_to_end(cache_key)
+                    if len(self._contact_cache) > CONTACT_CACHE_MAX_ENTRIES:
+                        self._contact_cache.popitem(last=False)
             
             if not scraped_contacts:
-                logger.warning(f"⚠️ No contacts found via web scraping for {website}")
+                if target_roles and strict_targeting:
+                    logger.warning(f"⚠️ No contacts matching target roles at {website} (strict targeting)")
+                else:
+                    logger.warning(f"⚠️ No contacts found via web scraping for {website}")
                 return []
             
             logger.info(f"✅ Found {len(scraped_contacts)} REAL contacts via web scraping")
             
             # Web scraper already filters by target_roles if provided
             # Convert scraped contacts to standardized format
-            contacts = []
-            for i, scraped_contact in enumerate(scraped_contacts[:10], 1):  # Limit to 10 contacts
-                # Scraper returns: contact_name, role, linkedin, email, confidence
-                full_name = scraped_contact.get("contact_name", "Unknown")
-                
-                # Split name into first/last (basic)
-                name_parts = full_name.split()
-                first_name = name_parts[0] if len(name_parts) > 0 else ""
-                last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-                
-                contact = {
-                    "id": f"contact_{domain.replace('.', '_')}_{i}",
+            # Values shared by every contact of this company are computed once
+            id_prefix = f"contact_{domain.replace('.', '_')}_"
+            industry = company.get("industry", "")
+            location = company.get("location", "")
+            # Every contact shares one read-only view of the company research; copy it
+            # (dict(contact["research_data"])) before changing it for a single contact
+            research_data = MappingProxyType(company.get("research_data") or {})
+            outreach_summary = company.get("outreach_summary", "")
+            created_at = _utc_now_iso()
+            targeting_match = bool(target_roles)  # Flag if we used role targeting
+            
+            def make_contact(i: int, scraped_contact: Dict[str, Any]) -> Dict[str, Any]:
+                full_name = scraped_contact.get("contact_name", "")
+                role = scraped_contact.get("role", "")
+                # Split name into first/last (basic) at the first run of any whitespace
+                name_parts = full_name.split(None, 1)
+                first_name = name_parts[0] if name_parts else ""
+                last_name = name_parts[1].strip() if len(name_parts) > 1 else ""
+                return {
+                    "id": f"{id_prefix}{i}",
                     "company": company_name,
                     "contact_name": full_name,
                     "first_name": first_name,
@@ -963,94 +2161,227 @@ class RealResearchEngine:
                     "linkedin": scraped_contact.get("linkedin", ""),
                     "twitter": "",
                     "website": website,
-                    "industry": company.get("industry", ""),
-                    "location": company.get("location", ""),
-                    "role": scraped_contact.get("role", "Team Member"),
+                    "industry": industry,
+                    "location": location,
+                    "role": role,
                     "department": "",
-                    "seniority": "Senior" if any(word in scraped_contact.get("role", "").lower() for word in ["director", "vp", "chief", "head", "manager"]) else "Mid",
+                    "seniority": "Senior" if role and _RE_SENIOR.search(role) else "Mid",
                     "confidence": scraped_contact.get("confidence", 0.7),
                     "verification_status": "scraped",
                     "source": "Web Scraping",
-                    "created_at": datetime.utcnow().isoformat(),
-                    "research_data": company.get("research_data", {}),
-                    "targeting_match": bool(target_roles)  # Flag if we used role targeting
+                    "created_at": created_at,
+                    "research_data": research_data,
+                    "outreach_summary": outreach_summary,
+                    "targeting_match": targeting_match
                 }
-                contacts.append(contact)
-                
-                logger.info(f"   [{i}] {full_name} - {contact['role']}")
-                if contact['linkedin']:
-                    logger.info(f"       🔗 LinkedIn: {contact['linkedin'][:50]}...")
-                if contact['email']:
-                    logger.info(f"       📧 Email: {contact['email']}")
+            
+            # Scraper returns: contact_name, role, linkedin, email, confidence.
+            # Rows without a name are skipped rather than failing the whole company.
+            named_contacts = [
+                scraped_contact for scraped_contact in scraped_contacts
+                if (scraped_contact.get("contact_name") or "").strip()
+            ]
+            contacts = [make_contact(i, scraped_contact) for i, scraped_contact in enumerate(named_contacts[:10], 1)]  # Limit to 10 contacts
+            
+            # Per-contact detail only at DEBUG; the summary below stays at INFO
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, contact in enumerate(contacts, 1):
+                    logger.debug("   [%d] %s - %s", i, contact['contact_name'], contact['role'])
+                    if contact['linkedin']:
+                        logger.debug("       🔗 LinkedIn: %.50s...", contact['linkedin'])
+                    if contact['email']:
+                        logger.debug("       📧 Email: %s", contact['email'])
             
             logger.info(f"✅ Returning {len(contacts)} REAL contacts for {company_name}")
             return contacts
             
         except Exception as e:
-            logger.error(f"❌ Exception finding contacts: {type(e).__name__}: {str(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Exception finding contacts: %s: %s", type(e).__name__, e)
             return []
     
+    def _lead_research_summary(self, lead: Dict[str, Any]) -> str:
+        """Research brief for a lead, precomputed per company by find_company_contacts when available"""
+        return lead.get("outreach_summary") or self._summarize_research(lead.get("research_data", {})) or "N/A"
+    
+    @staticmethod
+    def _lead_contact(lead: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """(company, contact id, contact name, role) of a lead
+        
+        Accepts the flat leads built by main_simple ("company", "contact_name",
+        "role") and the {"company": row, "contact": row} leads built by
+        OutreachGenerator from the companies and contacts tables.
+        """
+        company = lead.get("company")
+        if isinstance(company, dict):
+            company = company.get("name")
+        contact = lead.get("contact")
+        if isinstance(contact, dict):
+            contact_id = str(contact.get("id") or "")
+            contact_name = contact.get("contact_name") or " ".join(
+                part for part in (contact.get("first_name"), contact.get("last_name")) if part
+            )
+            role = contact.get("role") or contact.get("title")
+        else:
+            contact_id, contact_name, role = "", lead.get("contact_name"), lead.get("role")
+        return company or "Unknown Company", contact_id, contact_name or "there", role or "decision maker"
+    
+    def _outreach_cache_key(self, lead: Dict[str, Any], research_summary: str) -> str:
+        """Content hash of the inputs that shape a lead's outreach prompt"""
+        payload = _json_dumps([*self._lead_contact(lead), research_summary])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_outreach(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        return self._get_cached_response(self._response_cache_key("outreach", cache_key))
+    
+    def _cache_outreach(self, cache_key: str, outreach: Dict[str, Any]):
+        # Only LLM-generated outreach is cached; template fallbacks are retried next time
+        self._cache_response(
+            self._response_cache_key("outreach", cache_key), outreach, expire=LLM_RESPONSE_CACHE_TTL_SECONDS
+        )
+    
     async def generate_personalized_outreach(self, lead: Dict[str, Any]) -> Dict[str, Any]:
         """Generate personalized outreach messages for a lead"""
         if not self.openai_client and not self.claude_client:
-            return {
-                "linkedin_message": "Hi! I'd love to connect and discuss how we can help your business grow.",
-                "email_subject": "Partnership Opportunity",
-                "email_body": "Hi there, I'd love to discuss a potential partnership opportunity."
-            }
+            return dict(GENERIC_OUTREACH)
         
-        company = lead.get("company", "Unknown Company")
-        contact_name = lead.get("contact_name", "there")
-        role = lead.get("role", "decision maker")
-        research_data = lead.get("research_data", {})
+        research_summary = self._lead_research_summary(lead)
+        cache_key = self._outreach_cache_key(lead, research_summary)
+        cached = self._get_cached_outreach(cache_key)
+        if cached is not None:
+            return cached
         
-        outreach_prompt = f"""
-        Generate personalized outreach messages for:
+        company, _, contact_name, role = self._lead_contact(lead)
         
-        Contact: {contact_name} ({role}) at {company}
-        Company Research: {json.dumps(research_data, indent=2)}
-        
-        Create:
-        1. LinkedIn connection message (max 300 characters)
-        2. Email subject line (max 50 characters)
-        3. Email body (max 200 words)
-        
-        Make it personal, relevant, and valuable. Reference specific insights from the research.
-        Format as JSON:
-        {{
-            "linkedin_message": "...",
-            "email_subject": "...",
-            "email_body": "..."
-        }}
-        """
+        outreach_prompt = OUTREACH_PROMPT_TEMPLATE.format(
+            contact_name=contact_name, role=role, company=company, research=research_summary
+        )
         
         try:
-            if self.openai_client:
-                response = await self.openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": outreach_prompt}],
-                    temperature=0.7
-                )
-                outreach = json.loads(response.choices[0].message.content)
-            elif self.claude_client:
-                response = await self.claude_client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=1000,
-                    messages=[{"role": "user", "content": outreach_prompt}]
-                )
-                outreach = json.loads(response.content[0].text)
-            
+            outreach = await self._complete_outreach_json(OUTREACH_SYSTEM_PROMPT, outreach_prompt, 1000)
+            self._cache_outreach(cache_key, outreach)
             return outreach
             
         except Exception as e:
             logger.error(f"Error generating outreach: {e}")
-            return {
-                "linkedin_message": f"Hi {contact_name}, I'd love to connect and discuss how we can help {company} grow.",
-                "email_subject": f"Partnership Opportunity for {company}",
-                "email_body": f"Hi {contact_name}, I'd love to discuss a potential partnership opportunity for {company}."
-            }
+            fields = {"contact_name": contact_name, "company": company}
+            return {key: template.format_map(fields) for key, template in OUTREACH_FALLBACK_TEMPLATES.items()}
+    
+    def _build_batch_outreach_prompt(self, leads: List[Dict[str, Any]], research_summaries: List[str]) -> str:
+        """Outreach prompt covering several contacts, keyed by their position in `leads`
+        
+        Research shared by every contact (same company) is sent once; contacts at
+        different companies each carry their own company and research brief.
+        """
+        lead_contacts = [self._lead_contact(lead) for lead in leads]
+        company = lead_contacts[0][0]
+        single_company = all(lead_company == company for lead_company, _, _, _ in lead_contacts)
+        
+        contacts = []
+        for i, ((lead_company, _, contact_name, role), research_summary) in enumerate(
+            zip(lead_contacts, research_summaries)
+        ):
+            contact = {"contact_id": str(i), "name": contact_name, "role": role}
+            if not single_company:
+                contact["company"] = lead_company
+                contact["research"] = research_summary
+            contacts.append(contact)
+        
+        if single_company:
+            return OUTREACH_COMPANY_BATCH_PROMPT_TEMPLATE.format(
+                company=company, research=research_summaries[0], contacts=_json_dumps(contacts)
+            )
+        return OUTREACH_MIXED_BATCH_PROMPT_TEMPLATE.format(contacts=_json_dumps(contacts))
+    
+    async def _generate_outreach_chunk(self, leads: List[Dict[str, Any]],
+                                       research_summaries: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """One LLM call for a chunk of leads; None for any lead missing from the reply"""
+        outreach_prompt = self._build_batch_outreach_prompt(leads, research_summaries)
+        
+        results: Dict[str, Any] = {}
+        try:
+            results = await self._complete_outreach_json(
+                OUTREACH_BATCH_SYSTEM_PROMPT, outreach_prompt, min(4096, 1000 * len(leads))
+            )
+        except Exception as e:
+            logger.error(f"Error generating batch outreach, falling back to per-contact generation: {e}")
+        
+        outreach_keys = ("linkedin_message", "email_subject", "email_body")
+        outreach_list: List[Optional[Dict[str, Any]]] = []
+        for i in range(len(leads)):
+            outreach = results.get(str(i)) if isinstance(results, dict) else None
+            if not isinstance(outreach, dict) or not all(key in outreach for key in outreach_keys):
+                outreach = None
+            outreach_list.append(outreach)
+        return outreach_list
+    
+    async def generate_personalized_outreach_batch(self, leads: List[Dict[str, Any]],
+                                                   batch_size: int = OUTREACH_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Generate outreach for many contacts with one LLM call per `batch_size` leads
+        
+        Batches run concurrently under the LLM concurrency limit. Results are
+        returned in the same order as `leads`; any contact missing from a
+        malformed batch response falls back to generate_personalized_outreach.
+        """
+        outreach_list: List[Optional[Dict[str, Any]]] = [None] * len(leads)
+        async for i, outreach in self.iter_personalized_outreach(leads, batch_size):
+            outreach_list[i] = outreach
+        return outreach_list
+    
+    async def iter_personalized_outreach(self, leads: List[Dict[str, Any]],
+                                         batch_size: int = OUTREACH_BATCH_SIZE) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (index into `leads`, outreach) as each lead's outreach becomes ready
+        
+        Same batching, caching and fallbacks as generate_personalized_outreach_batch,
+        but in completion order, so callers can persist or send each result without
+        waiting for the slowest batch. Closing the iterator early cancels the rest.
+        """
+        use_batches = bool(self.openai_client or self.claude_client)
+        research_summaries = [self._lead_research_summary(lead) for lead in leads]
+        cache_keys = [self._outreach_cache_key(lead, summary) for lead, summary in zip(leads, research_summaries)]
+        
+        pending = []
+        for i, cache_key in enumerate(cache_keys):
+            cached = self._get_cached_outreach(cache_key) if use_batches else None
+            if cached is not None:
+                yield i, cached
+            else:
+                pending.append(i)
+        
+        # task -> (lead indices, whether it is a batch call)
+        tasks: Dict[asyncio.Task, Tuple[List[int], bool]] = {}
+        
+        def generate_single(i: int):
+            tasks[asyncio.create_task(self.generate_personalized_outreach(leads[i]))] = ([i], False)
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            if use_batches and len(chunk) > 1:
+                task = asyncio.create_task(self._generate_outreach_chunk(
+                    [leads[i] for i in chunk], [research_summaries[i] for i in chunk]
+                ))
+                tasks[task] = (chunk, True)
+            else:
+                for i in chunk:
+                    generate_single(i)
+        
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    chunk, is_batch = tasks.pop(task)
+                    if not is_batch:
+                        yield chunk[0], task.result()
+                        continue
+                    for i, outreach in zip(chunk, task.result()):
+                        if outreach is None:
+                            # Missing from a malformed batch reply; generate it on its own
+                            generate_single(i)
+                        else:
+                            self._cache_outreach(cache_keys[i], outreach)
+                            yield i, outreach
+        finally:
+            for task in tasks:
+                task.cancel()
 
 # Global instance
 real_research_engine = RealResearchEngine()
@@ -1065,8 +2396,29 @@ async def search_companies(criteria: Dict[str, Any], target_count: int) -> List[
 async def research_company_deep(company: Dict[str, Any]) -> Dict[str, Any]:
     return await real_research_engine.research_company_deep(company)
 
-async def find_company_contacts(company: Dict[str, Any], targeting_criteria: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-    return await real_research_engine.find_company_contacts(company, targeting_criteria)
+async def research_companies_deep(companies: List[Dict[str, Any]],
+                                  concurrency: int = RESEARCH_CONCURRENCY) -> List[Dict[str, Any]]:
+    return await real_research_engine.research_companies_deep(companies, concurrency)
+
+async def find_company_contacts(company: Dict[str, Any], targeting_criteria: Dict[str, Any] = None,
+                                strict_targeting: bool = True) -> List[Dict[str, Any]]:
+    return await real_research_engine.find_company_contacts(company, targeting_criteria, strict_targeting)
 
 async def generate_personalized_outreach(lead: Dict[str, Any]) -> Dict[str, Any]:
     return await real_research_engine.generate_personalized_outreach(lead)
+
+async def generate_personalized_outreach_batch(leads: List[Dict[str, Any]],
+                                               batch_size: int = OUTREACH_BATCH_SIZE) -> List[Dict[str, Any]]:
+    return await real_research_engine.generate_personalized_outreach_batch(leads, batch_size)
+
+def iter_personalized_outreach(leads: List[Dict[str, Any]],
+                               batch_size: int = OUTREACH_BATCH_SIZE) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    return real_research_engine.iter_personalized_outreach(leads, batch_size)
+
+async def warm_up_research_engine():
+    await real_research_engine.warm_up()
+
+async def close_research_engine():
+    await real_research_engine.aclose()
+    if close_web_scraper is not None:
+        await close_web_scraper()
@@ -5,10 +5,16 @@ Builds company profiles using the real_research module.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import asyncpg
 
 from ..database.connection import DatabaseConnection
 from ..models.schemas import (
@@ -19,18 +25,146 @@ from ..models.schemas import (
     TechStack,
     BuyingTriggers,
 )
-from .real_research import research_company_deep
+from .real_research import ANALYSIS_FIELDS, research_company_deep
 
 logger = logging.getLogger(__name__)
 
+# Profiles refreshed within this window are served from company_profiles
+# instead of re-running the research pipeline
+PROFILE_TTL_SECONDS = int(os.getenv("RESEARCH_PROFILE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# In-process cache of get_company_profile results. Entries are dropped when
+# Postgres announces a change on PROFILE_CHANGED_CHANNEL; the TTL bounds
+# staleness if that notification is missed (e.g. the listener is reconnecting)
+PROFILE_CACHE_MAX_ENTRIES = 10_000
+PROFILE_CACHE_TTL_SECONDS = 300
+PROFILE_CHANGED_CHANNEL = "company_profile_changed"
+
+# Backoff before reconnecting the change listener, doubled per failed attempt
+LISTENER_RECONNECT_DELAY_SECONDS = 1
+LISTENER_RECONNECT_MAX_DELAY_SECONDS = 60
+
+# Upsert for a researched profile. Kept as one constant string so asyncpg's
+# per-connection statement cache reuses the prepared plan on every call
+PROFILE_UPSERT_SQL = """
+INSERT INTO company_profiles (
+    id, company_id, research_summary, pain_points, growth_signals,
+    tech_stack, buying_triggers, recent_investments,
+    reasons_to_reach_out, sources, research_confidence,
+    created_at, updated_at
+)
+VALUES (
+    $1, $2, $3, $4, $5,
+    $6, $7, $8,
+    $9, $10, $11,
+    $12, $13
+)
+ON CONFLICT (company_id) DO UPDATE SET
+    research_summary = EXCLUDED.research_summary,
+    pain_points = EXCLUDED.pain_points,
+    growth_signals = EXCLUDED.growth_signals,
+    tech_stack = EXCLUDED.tech_stack,
+    buying_triggers = EXCLUDED.buying_triggers,
+    recent_investments = EXCLUDED.recent_investments,
+    reasons_to_reach_out = EXCLUDED.reasons_to_reach_out,
+    sources = EXCLUDED.sources,
+    research_confidence = EXCLUDED.research_confidence,
+    updated_at = EXCLUDED.updated_at
+"""
+
+# JSONB columns of a profile, in PROFILE_UPSERT_SQL parameter order ($3-$10)
+PROFILE_JSON_FIELDS = (
+    "research_summary", "pain_points", "growth_signals", "tech_stack",
+    "buying_triggers", "recent_investments", "reasons_to_reach_out", "sources",
+)
+
+# JSONB columns returned as nested response models
+PROFILE_MODELS = {
+    "research_summary": ResearchSummary,
+    "pain_points": PainPoints,
+    "growth_signals": GrowthSignals,
+    "tech_stack": TechStack,
+    "buying_triggers": BuyingTriggers,
+}
+
+
+def _profile_fields(research_data: Dict[str, Any]) -> Dict[str, Any]:
+    """company_profiles columns for a research_company_deep result
+
+    The research pipeline returns the company row plus one list of strings per
+    ANALYSIS_FIELDS entry; those lists are placed into the nested profile models.
+    """
+
+    def items(field: str) -> List[str]:
+        value = research_data.get(field)
+        return [str(item) for item in value] if isinstance(value, list) else []
+
+    website = research_data.get("website")
+    return {
+        "research_summary": ResearchSummary(
+            company_overview=research_data.get("description") or research_data.get("outreach_summary") or "",
+            key_initiatives=[],
+            recent_developments=[],
+            competitive_position="",
+            growth_opportunities=items("reasons_to_reach_out"),
+        ).model_dump(),
+        "pain_points": PainPoints(
+            operational_challenges=items("pain_points"),
+            technology_gaps=items("technology_needs"),
+            compliance_requirements=[],
+            cost_pressures=[],
+        ).model_dump(),
+        "growth_signals": GrowthSignals(
+            recent_funding=None,
+            hiring_trends=[],
+            expansion_plans=items("growth_signals"),
+            technology_adoption=[],
+        ).model_dump(),
+        "tech_stack": TechStack(
+            primary_technologies=[],
+            infrastructure=[],
+            development_tools=[],
+            cloud_platforms=[],
+        ).model_dump(),
+        "buying_triggers": BuyingTriggers(
+            immediate_needs=items("buying_triggers"),
+            budget_cycle=None,
+            decision_makers=items("key_decision_makers"),
+            evaluation_criteria=[],
+        ).model_dump(),
+        "recent_investments": None,
+        "reasons_to_reach_out": items("reasons_to_reach_out"),
+        "sources": [{"type": "website", "url": website}] if website else [],
+        # Share of analysis fields the model filled in
+        "research_confidence": sum(1 for field in ANALYSIS_FIELDS if items(field)) / len(ANALYSIS_FIELDS),
+    }
+
 
 class ResearchEngine:
     """Create and persist deep company research profiles."""
 
     def __init__(self, db: Optional[DatabaseConnection] = None):
         self.db = db or DatabaseConnection()
+        # Profile writes still in flight; see flush_pending_writes
+        self._pending_writes: set = set()
+        # LRU cache of read profiles: company_id -> (cached_at, profile)
+        self._profile_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Bumped whenever cached profiles are invalidated; see get_company_profile
+        self._cache_generation = 0
+        # Connection of its own (not a pool slot) that LISTENs for profile changes
+        self._listener_connection: Optional[asyncpg.Connection] = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def research_company(
+        self, company_id: str, force_refresh: bool = False
+    ) -> Optional[CompanyProfileResponse]:
+        if not force_refresh:
+            profile = await self._get_fresh_profile(company_id)
+            if profile:
+                logger.info("Research cache hit for company %s", company_id)
+                return profile
+            logger.info("Research cache miss for company %s", company_id)
 
-    async def research_company(self, company_id: str) -> Optional[CompanyProfileResponse]:
         company = await self.db.fetch_one("SELECT * FROM companies WHERE id = $1", company_id)
         if not company:
             logger.warning("Cannot research company %s: record not found", company_id)
@@ -40,66 +174,74 @@ class ResearchEngine:
         if not research_data:
             logger.warning("No research data returned for company %s", company_id)
             return None
+        if not any(research_data.get(field) for field in ANALYSIS_FIELDS):
+            # Without an AI analysis there is nothing worth keeping for PROFILE_TTL_SECONDS
+            logger.warning("No AI analysis returned for company %s", company_id)
+            return None
 
-        profile_id = str(uuid.uuid4())
-        payload = {
-            "id": profile_id,
+        # created_at and updated_at share one timestamp; the columns are TIMESTAMPTZ
+        now = datetime.now(timezone.utc)
+        row = {
+            "id": str(uuid.uuid4()),
             "company_id": company_id,
-            "research_summary": research_data.get("research_summary"),
-            "pain_points": research_data.get("pain_points"),
-            "growth_signals": research_data.get("growth_signals"),
-            "tech_stack": research_data.get("tech_stack"),
-            "buying_triggers": research_data.get("buying_triggers"),
-            "recent_investments": research_data.get("recent_investments"),
-            "reasons_to_reach_out": research_data.get("reasons_to_reach_out"),
-            "sources": research_data.get("sources"),
-            "research_confidence": float(research_data.get("research_confidence") or 0.0),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            **_profile_fields(research_data),
+            "created_at": now,
+            "updated_at": now,
         }
 
-        await self.db.execute(
-            """
-            INSERT INTO company_profiles (
-                id, company_id, research_summary, pain_points, growth_signals,
-                tech_stack, buying_triggers, recent_investments,
-                reasons_to_reach_out, sources, research_confidence,
-                created_at, updated_at
-            )
-            VALUES (
-                $1, $2, $3, $4, $5,
-                $6, $7, $8,
-                $9, $10, $11,
-                $12, $13
+        # Nothing below depends on the write, so it finishes in the background
+        task = asyncio.create_task(self._write_profile(row))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+        return self._build_profile(row)
+
+    async def flush_pending_writes(self) -> None:
+        """Wait for background profile writes to finish (call before closing the pool)"""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+    async def start(self) -> None:
+        """Start listening for profile changes; call once at application startup
+
+        Without a listener (not started, SQLite, or Postgres unreachable) cached
+        profiles are only dropped when PROFILE_CACHE_TTL_SECONDS expires.
+        """
+        if self._listener_task is None and not self.db.connection_string.startswith("sqlite"):
+            self._listener_task = asyncio.create_task(self._listen_for_changes())
+
+    async def aclose(self) -> None:
+        """Finish pending profile writes, then stop the change listener and close its connection"""
+        await self.flush_pending_writes()
+        task, self._listener_task = self._listener_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._profile_cache.clear()
+
+    async def _write_profile(self, row: Dict[str, Any]) -> None:
+        try:
+            await self.db.execute(
+                PROFILE_UPSERT_SQL,
+                row["id"],
+                row["company_id"],
+                *(row[field] for field in PROFILE_JSON_FIELDS),
+                row["research_confidence"],
+                row["created_at"],
+                row["updated_at"],
             )
-            ON CONFLICT (company_id) DO UPDATE SET
-                research_summary = EXCLUDED.research_summary,
-                pain_points = EXCLUDED.pain_points,
-                growth_signals = EXCLUDED.growth_signals,
-                tech_stack = EXCLUDED.tech_stack,
-                buying_triggers = EXCLUDED.buying_triggers,
-                recent_investments = EXCLUDED.recent_investments,
-                reasons_to_reach_out = EXCLUDED.reasons_to_reach_out,
-                sources = EXCLUDED.sources,
-                research_confidence = EXCLUDED.research_confidence,
-                updated_at = EXCLUDED.updated_at
-            """,
-            payload["id"],
-            payload["company_id"],
-            payload["research_summary"],
-            payload["pain_points"],
-            payload["growth_signals"],
-            payload["tech_stack"],
-            payload["buying_triggers"],
-            payload["recent_investments"],
-            payload["reasons_to_reach_out"],
-            payload["sources"],
-            payload["research_confidence"],
-            payload["created_at"],
-            payload["updated_at"],
-        )
+        except Exception:
+            # Runs as a background task, so there is no caller to raise to
+            logger.exception("Failed to store research profile for company %s", row["company_id"])
+            return
+        self._profile_cache.pop(row["company_id"], None)
 
     async def get_company_profile(self, company_id: str) -> Optional[CompanyProfileResponse]:
+        cached = self._profile_cache.get(company_id)
+        if cached is not None and time.monotonic() - cached[0] < PROFILE_CACHE_TTL_SECONDS:
+            self._profile_cache.move_to_end(company_id)
+            return cached[1]
+
+        generation = self._cache_generation
         row = await self.db.fetch_one(
             "SELECT * FROM company_profiles WHERE company_id = $1",
             company_id,
@@ -107,14 +249,83 @@ class ResearchEngine:
         if not row:
             return None
 
+        profile = self._build_profile(row)
+        if generation != self._cache_generation:
+            # A change was announced while the SELECT ran; the row may predate it
+            return profile
+        self._profile_cache[company_id] = (time.monotonic(), profile)
+        self._profile_cache.move_to_end(company_id)
+        if len(self._profile_cache) > PROFILE_CACHE_MAX_ENTRIES:
+            self._profile_cache.popitem(last=False)
+        return profile
+
+    async def _listen_for_changes(self) -> None:
+        """Keep a LISTEN connection open, reconnecting with backoff when it drops"""
+        delay = LISTENER_RECONNECT_DELAY_SECONDS
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.db.connection_string)
+                terminated = asyncio.Event()
+                connection.add_termination_listener(lambda _connection: terminated.set())
+                await connection.add_listener(PROFILE_CHANGED_CHANNEL, self._on_profile_changed)
+                self._listener_connection = connection
+                # Changes committed while nothing was listening were never announced
+                self._invalidate_all()
+                delay = LISTENER_RECONNECT_DELAY_SECONDS
+                await terminated.wait()
+                logger.warning("Profile change listener disconnected, reconnecting in %ss", delay)
+            except Exception as exc:
+                logger.warning(
+                    "Profile change listener unavailable, relying on cache TTL; retrying in %ss: %s", delay, exc
+                )
+            finally:
+                self._listener_connection = None
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LISTENER_RECONNECT_MAX_DELAY_SECONDS)
+
+    def _on_profile_changed(self, connection, pid, channel, payload) -> None:
+        self._cache_generation += 1
+        self._profile_cache.pop(payload, None)
+
+    def _invalidate_all(self) -> None:
+        self._cache_generation += 1
+        self._profile_cache.clear()
+
+    async def _get_fresh_profile(self, company_id: str) -> Optional[CompanyProfileResponse]:
+        """Stored profile for the company if it was refreshed within the TTL"""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=PROFILE_TTL_SECONDS)
+        cached = self._profile_cache.get(company_id)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < PROFILE_CACHE_TTL_SECONDS
+            and cached[1].updated_at > cutoff
+        ):
+            return cached[1]
+
+        row = await self.db.fetch_one(
+            "SELECT * FROM company_profiles WHERE company_id = $1 AND updated_at > $2",
+            company_id,
+            cutoff,
+        )
+        if not row:
+            return None
+
+        try:
+            return self._build_profile(row)
+        except ValueError as exc:
+            # An incomplete stored profile is worth researching again
+            logger.warning("Ignoring stored profile for company %s: %s", company_id, exc)
+            return None
+
+    def _build_profile(self, row: Dict[str, Any]) -> CompanyProfileResponse:
+        models = {field: self._as_model(model, row.get(field)) for field, model in PROFILE_MODELS.items()}
         return CompanyProfileResponse(
             id=row["id"],
             company_id=row["company_id"],
-            research_summary=self._as_model(ResearchSummary, row.get("research_summary")),
-            pain_points=self._as_model(PainPoints, row.get("pain_points")),
-            growth_signals=self._as_model(GrowthSignals, row.get("growth_signals")),
-            tech_stack=self._as_model(TechStack, row.get("tech_stack")),
-            buying_triggers=self._as_model(BuyingTriggers, row.get("buying_triggers")),
+            **models,
             recent_investments=row.get("recent_investments"),
             reasons_to_reach_out=row.get("reasons_to_reach_out"),
             sources=row.get("sources"),
@@ -128,7 +339,8 @@ class ResearchEngine:
             return None
         if isinstance(value, model):
             return value
-        if isinstance(value, dict):
-            return model(**value)
-        # asyncpg may return JSONB as dict already, but guard for strings.
-        return model(**value)  # type: ignore[arg-type]
+        # The pool's JSONB codec yields dicts; rows written as JSON text parse
+        # straight from the string in pydantic-core
+        if isinstance(value, (str, bytes)):
+            return model.model_validate_json(value)
+        return model.model_validate(value)
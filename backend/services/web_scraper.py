@@ -6,7 +6,8 @@ Scrapes company websites to find team pages, leadership pages, and LinkedIn prof
 import logging
 import re
 import asyncio
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Pattern, Sequence, Tuple
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 
@@ -20,18 +21,73 @@ except ImportError:
     AIOHTTP_AVAILABLE = False
     logger.warning("aiohttp not available for web scraping")
 
+# Contacts returned per company; team pages stop being scraped once this many match
+MAX_CONTACTS_PER_COMPANY = 10
+
+
+@lru_cache(maxsize=256)
+def role_pattern(target_roles: Tuple[str, ...]) -> Optional[Pattern]:
+    """One alternation matching any word of any target role, compiled once per set of roles
+    
+    Longest keywords come first so the reported match is the most specific one.
+    """
+    keywords = {word for role in target_roles if role for word in role.lower().split()}
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(word) for word in sorted(keywords, key=len, reverse=True)))
+
+
+def matches_target_roles(role: Optional[str], target_roles: Optional[Sequence[str]]) -> bool:
+    """True if any word of any target role occurs in `role`; always True without target roles"""
+    pattern = role_pattern(tuple(target_roles or ()))
+    return pattern is None or pattern.search((role or "").lower()) is not None
+
 
 class WebContactScraper:
     """Scrapes company websites to find contact information"""
     
     def __init__(self):
-        self.timeout = aiohttp.ClientTimeout(total=15)
+        # Bounded connect/read so one unresponsive site cannot stall contact discovery
+        self.timeout = aiohttp.ClientTimeout(total=15, connect=3, sock_read=5)
+        # One pooled session reused for every page fetch, bound to the loop that created it
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it on first use in the running event loop
+        
+        A session left over from an earlier event loop is closed before it is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            await self._close_session()
+            self._loop = loop
+        # Re-checked after the await: a concurrent caller may have created one meanwhile
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, use_dns_cache=True, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+        return self._session
+    
+    async def _close_session(self):
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except RuntimeError:
+            # Its event loop is already closed and took the sockets with it
+            session.detach()
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        await self._close_session()
         
     async def find_contacts_at_company(
         self, 
         company_name: str, 
         website: str,
-        target_roles: List[str] = None
+        target_roles: List[str] = None,
+        strict_targeting: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Scrape a company website to find team members and their LinkedIn profiles
@@ -40,6 +96,8 @@ class WebContactScraper:
             company_name: Name of the company
             website: Company website URL
             target_roles: Optional list of target role titles (e.g., ["Investment Director", "Portfolio Manager"])
+            strict_targeting: If False and no contact matches target_roles, return the
+                unfiltered contacts instead of none
             
         Returns:
             List of contact dictionaries with name, title, linkedin, etc.
@@ -60,8 +118,10 @@ class WebContactScraper:
             
             logger.info(f"✅ Found {len(team_pages)} potential team pages")
             
-            # Step 2: Scrape each team page for contacts
+            # Step 2: Scrape each team page, filtering by target roles as we go,
+            # and stop once enough matching contacts are found
             all_contacts = []
+            unfiltered_contacts = []
             
             for page_url in team_pages[:3]:  # Limit to first 3 pages
                 logger.info(f"📄 Scraping: {page_url}")
@@ -69,22 +129,25 @@ class WebContactScraper:
                 
                 if contacts:
                     logger.info(f"  ✅ Found {len(contacts)} contacts on this page")
+                    if not strict_targeting:
+                        unfiltered_contacts.extend(contacts)
+                    if target_roles:
+                        logger.info(f"🎯 Filtering {len(contacts)} contacts by target roles: {target_roles}")
+                        contacts = self._filter_by_roles(contacts, target_roles)
+                        logger.info(f"✅ Filtered to {len(contacts)} matching contacts")
                     all_contacts.extend(contacts)
-                    
-            # Step 3: Filter by target roles if specified
-            if target_roles and all_contacts:
-                logger.info(f"🎯 Filtering {len(all_contacts)} contacts by target roles: {target_roles}")
-                filtered = self._filter_by_roles(all_contacts, target_roles)
-                logger.info(f"✅ Filtered to {len(filtered)} matching contacts")
-                return filtered[:10]  # Return max 10
+                    if len(all_contacts) >= MAX_CONTACTS_PER_COMPANY:
+                        break
+            
+            if target_roles and not all_contacts and unfiltered_contacts:
+                logger.info("⚠️ No contacts match target roles, returning unfiltered contacts (strict_targeting=False)")
+                all_contacts = unfiltered_contacts
             
             logger.info(f"✅ Scraped {len(all_contacts)} total contacts from {website}")
-            return all_contacts[:10]  # Return max 10
+            return all_contacts[:MAX_CONTACTS_PER_COMPANY]
             
         except Exception as e:
-            logger.error(f"❌ Error scraping website {website}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("❌ Error scraping website %s: %s", website, e)
             return []
     
     async def _find_team_pages(self, website: str) -> List[str]:
@@ -103,42 +166,42 @@ class WebContactScraper:
         potential_pages = []
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                # Fetch homepage
-                async with session.get(website, allow_redirects=True) as response:
-                    if response.status != 200:
-                        logger.warning(f"⚠️ Could not fetch homepage: HTTP {response.status}")
-                        return []
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Find all links
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        full_url = urljoin(website, href)
-                        
-                        # Check if link contains team-related keywords
-                        href_lower = href.lower()
-                        link_text_lower = link.get_text().lower()
-                        
-                        for keyword in team_page_keywords:
-                            if keyword in href_lower or keyword.replace('/', '') in link_text_lower:
-                                if full_url not in potential_pages:
-                                    potential_pages.append(full_url)
-                                    logger.info(f"  📍 Found potential team page: {full_url}")
-                                break
+            session = await self._get_session()
+            # Fetch homepage
+            async with session.get(website, allow_redirects=True) as response:
+                if response.status != 200:
+                    logger.warning(f"⚠️ Could not fetch homepage: HTTP {response.status}")
+                    return []
+                
+                html = await response.text()
+                soup = BeautifulSoup(html, 'html.parser')
+                
+                # Find all links
+                for link in soup.find_all('a', href=True):
+                    href = link['href']
+                    full_url = urljoin(website, href)
                     
-                    # If no team pages found in links, try common URL patterns
-                    if not potential_pages:
-                        logger.info("  🔍 No team links found, trying common URL patterns...")
-                        base_url = f"{urlparse(website).scheme}://{urlparse(website).netloc}"
-                        
-                        for keyword in ['/team', '/leadership', '/about-us', '/people', '/our-team']:
-                            potential_pages.append(f"{base_url}{keyword}")
+                    # Check if link contains team-related keywords
+                    href_lower = href.lower()
+                    link_text_lower = link.get_text().lower()
                     
-                    return potential_pages[:5]  # Return max 5 team pages
+                    for keyword in team_page_keywords:
+                        if keyword in href_lower or keyword.replace('/', '') in link_text_lower:
+                            if full_url not in potential_pages:
+                                potential_pages.append(full_url)
+                                logger.info(f"  📍 Found potential team page: {full_url}")
+                            break
+                
+                # If no team pages found in links, try common URL patterns
+                if not potential_pages:
+                    logger.info("  🔍 No team links found, trying common URL patterns...")
+                    base_url = f"{urlparse(website).scheme}://{urlparse(website).netloc}"
                     
+                    for keyword in ['/team', '/leadership', '/about-us', '/people', '/our-team']:
+                        potential_pages.append(f"{base_url}{keyword}")
+                
+                return potential_pages[:5]  # Return max 5 team pages
+                
         except Exception as e:
             logger.error(f"❌ Error finding team pages: {e}")
             return []
@@ -156,38 +219,38 @@ class WebContactScraper:
         contacts = []
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(page_url, allow_redirects=True) as response:
-                    if response.status != 200:
-                        logger.warning(f"⚠️ Could not fetch team page: HTTP {response.status}")
-                        return []
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Strategy 1: Look for common team member structures
-                    # Many sites use divs/sections with class names like "team-member", "person", "staff-member"
-                    team_containers = soup.find_all(
-                        ['div', 'section', 'article', 'li'],
-                        class_=re.compile(r'(team|member|person|staff|executive|leadership|employee|profile)', re.I)
-                    )
-                    
-                    logger.info(f"  🔍 Found {len(team_containers)} potential team member containers")
-                    
-                    for container in team_containers[:30]:  # Process max 30 containers
-                        contact = self._extract_contact_from_container(container, company_name)
-                        if contact and contact.get('contact_name'):
-                            contacts.append(contact)
-                    
-                    # Strategy 2: Look for LinkedIn links on the page (people often link their LinkedIn)
-                    if len(contacts) < 5:  # If we didn't find many contacts, try LinkedIn link strategy
-                        logger.info("  🔍 Trying LinkedIn link extraction strategy...")
-                        linkedin_contacts = self._extract_from_linkedin_links(soup, company_name)
-                        contacts.extend(linkedin_contacts)
-                    
-                    logger.info(f"  ✅ Extracted {len(contacts)} contacts from page")
-                    return contacts
-                    
+            session = await self._get_session()
+            async with session.get(page_url, allow_redirects=True) as response:
+                if response.status != 200:
+                    logger.warning(f"⚠️ Could not fetch team page: HTTP {response.status}")
+                    return []
+                
+                html = await response.text()
+                soup = BeautifulSoup(html, 'html.parser')
+                
+                # Strategy 1: Look for common team member structures
+                # Many sites use divs/sections with class names like "team-member", "person", "staff-member"
+                team_containers = soup.find_all(
+                    ['div', 'section', 'article', 'li'],
+                    class_=re.compile(r'(team|member|person|staff|executive|leadership|employee|profile)', re.I)
+                )
+                
+                logger.info(f"  🔍 Found {len(team_containers)} potential team member containers")
+                
+                for container in team_containers[:30]:  # Process max 30 containers
+                    contact = self._extract_contact_from_container(container, company_name)
+                    if contact and contact.get('contact_name'):
+                        contacts.append(contact)
+                
+                # Strategy 2: Look for LinkedIn links on the page (people often link their LinkedIn)
+                if len(contacts) < 5:  # If we didn't find many contacts, try LinkedIn link strategy
+                    logger.info("  🔍 Trying LinkedIn link extraction strategy...")
+                    linkedin_contacts = self._extract_from_linkedin_links(soup, company_name)
+                    contacts.extend(linkedin_contacts)
+                
+                logger.info(f"  ✅ Extracted {len(contacts)} contacts from page")
+                return contacts
+                
         except Exception as e:
             logger.error(f"❌ Error scraping team page {page_url}: {e}")
             return []
@@ -239,9 +302,9 @@ class WebContactScraper:
                     "confidence": 0.8 if (title and linkedin) else 0.6
                 }
                 
-                logger.info(f"    👤 {name} - {title or 'No title'}")
+                logger.debug("    👤 %s - %s", name, title or 'No title')
                 if linkedin:
-                    logger.info(f"       🔗 LinkedIn: {linkedin[:50]}...")
+                    logger.debug("       🔗 LinkedIn: %.50s...", linkedin)
                 
                 return contact
             
@@ -288,8 +351,8 @@ class WebContactScraper:
                                 "confidence": 0.7
                             }
                             contacts.append(contact)
-                            logger.info(f"    👤 {name} - {title}")
-                            logger.info(f"       🔗 LinkedIn: {linkedin_url[:50]}...")
+                            logger.debug("    👤 %s - %s", name, title)
+                            logger.debug("       🔗 LinkedIn: %.50s...", linkedin_url)
             
             except Exception as e:
                 continue
@@ -301,26 +364,16 @@ class WebContactScraper:
         if not target_roles:
             return contacts
         
-        filtered = []
-        
-        # Extract keywords from target roles
-        role_keywords = set()
-        for role in target_roles:
-            # Split and add each word
-            words = role.lower().split()
-            role_keywords.update(words)
-        
-        logger.info(f"  🎯 Filtering by keywords: {role_keywords}")
+        logger.info(f"  🎯 Filtering by target roles: {', '.join(target_roles)}")
         
+        filtered = []
         for contact in contacts:
-            contact_role = (contact.get('role') or '').lower()
-            
             # Check if any target role keyword appears in contact's role
-            if any(keyword in contact_role for keyword in role_keywords):
+            if matches_target_roles(contact.get('role'), target_roles):
                 filtered.append(contact)
-                logger.info(f"    ✅ Matched: {contact.get('contact_name')} - {contact.get('role')}")
+                logger.debug("    ✅ Matched: %s - %s", contact.get('contact_name'), contact.get('role'))
             else:
-                logger.info(f"    ❌ Skipped: {contact.get('contact_name')} - {contact.get('role')}")
+                logger.debug("    ❌ Skipped: %s - %s", contact.get('contact_name'), contact.get('role'))
 
         return filtered
 
@@ -373,7 +426,8 @@ web_scraper = WebContactScraper()
 async def scrape_company_contacts(
     company_name: str,
     website: str,
-    target_roles: List[str] = None
+    target_roles: List[str] = None,
+    strict_targeting: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Scrape a company website to find contacts
@@ -382,8 +436,14 @@ async def scrape_company_contacts(
         company_name: Name of the company
         website: Company website URL
         target_roles: Optional list of roles to target
+        strict_targeting: Return nothing rather than unmatched contacts when roles are targeted
         
     Returns:
         List of contact dictionaries
     """
-    return await web_scraper.find_contacts_at_company(company_name, website, target_roles)
+    return await web_scraper.find_contacts_at_company(company_name, website, target_roles, strict_targeting)
+
+
+async def close_web_scraper():
+    """Close the scraper's shared HTTP session"""
+    await web_scraper.aclose()
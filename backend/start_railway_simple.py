@@ -92,6 +92,14 @@ def main():
             # Don't raise - continue anyway
             logger.warning("⚠️ Continuing despite app test failure")
         
+        # uvicorn's "auto" loop uses uvloop (from uvicorn[standard]) when it can be
+        # imported and the asyncio loop otherwise; log which one that will be
+        try:
+            import uvloop  # noqa: F401
+            logger.info("✅ uvloop available, using it as the event loop")
+        except ImportError:
+            logger.warning("⚠️ uvloop not installed, using the default asyncio event loop")
+        
         # Run the application
         logger.info("🚀 Starting uvicorn server...")
         logger.info(f"uvicorn.run called with: host={host}, port={port}")
@@ -102,7 +110,8 @@ def main():
             port=port,
             log_level="info",
             access_log=True,
-            reload=False
+            reload=False,
+            loop="auto"
         )
         
     except Exception as e:
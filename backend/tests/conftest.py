@@ -0,0 +1,49 @@
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+# Keep the engine's on-disk response cache out of the shared /tmp location
+os.environ.setdefault("RESEARCH_CACHE_DIR", tempfile.mkdtemp(prefix="research_cache_"))
+
+import diskcache
+
+from backend.services.real_research import RealResearchEngine, _json_dumps
+
+
+class FakeOpenAI:
+    """Stands in for AsyncOpenAI: records chat.completions.create calls and
+    answers each with the JSON object returned by `reply(call_kwargs)`"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = _json_dumps(self.reply(kwargs))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    """Engine bound to the test's event loop with no AI clients and a private disk cache"""
+    engine = RealResearchEngine()
+    engine._response_cache.close()
+    engine._response_cache = diskcache.Cache(str(tmp_path / "responses"))
+    engine._bind_to_running_loop()
+    engine._llm_clients = {"openai": None, "claude": None, "extraction": None}
+    yield engine
+    await engine.aclose()
+
+
+@pytest.fixture
+def fake_openai(engine):
+    def install(reply):
+        client = FakeOpenAI(reply)
+        engine._llm_clients["openai"] = client
+        return client
+    return install
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from backend.services import real_research
+from backend.services.real_research import (
+    ANALYSIS_BATCH_SIZE,
+    ANALYSIS_BATCH_SYSTEM_PROMPT,
+    ANALYSIS_FIELDS,
+    ANALYSIS_RESPONSE_FORMAT,
+    ANALYSIS_SYSTEM_PROMPT,
+    RealResearchEngine,
+)
+
+
+def research_data(name):
+    return {"company": {"name": name, "website": f"https://{name.lower()}.com"},
+            "website_content": f"{name} builds software"}
+
+
+def analysis_for(label):
+    return {field: [f"{label} {field}"] for field in ANALYSIS_FIELDS}
+
+
+def reply_per_company(call):
+    """Single calls get one analysis; batch calls one analysis per schema id"""
+    schema = call["response_format"]["json_schema"]["schema"]
+    if "required" in schema and schema["required"] != list(ANALYSIS_FIELDS):
+        return {index: analysis_for(f"company {index}") for index in schema["required"]}
+    return analysis_for("single")
+
+
+@pytest.fixture
+def no_flush_timer(monkeypatch):
+    # Only a full queue flushes; the 50 ms window would otherwise race the assertions
+    monkeypatch.setattr(real_research, "ANALYSIS_BATCH_WINDOW_SECONDS", 60)
+
+
+@pytest.mark.asyncio
+async def test_single_queued_request_uses_the_single_company_prompt(engine, fake_openai):
+    client = fake_openai(reply_per_company)
+
+    analysis = await engine._analyze_company_with_ai(research_data("Acme"))
+
+    assert analysis == analysis_for("single")
+    assert len(client.calls) == 1
+    assert client.calls[0]["messages"][0]["content"] == ANALYSIS_SYSTEM_PROMPT
+    assert client.calls[0]["response_format"] == ANALYSIS_RESPONSE_FORMAT
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch_call(engine, fake_openai):
+    client = fake_openai(reply_per_company)
+
+    analyses = await asyncio.gather(
+        *(engine._analyze_company_with_ai(research_data(name)) for name in ("Acme", "Globex", "Initech"))
+    )
+
+    assert len(client.calls) == 1
+    assert client.calls[0]["messages"][0]["content"] == ANALYSIS_BATCH_SYSTEM_PROMPT
+    assert analyses == [analysis_for("company 0"), analysis_for("company 1"), analysis_for("company 2")]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_flushes_without_waiting_for_the_window(engine, fake_openai, no_flush_timer):
+    client = fake_openai(reply_per_company)
+
+    analyses = await asyncio.wait_for(asyncio.gather(
+        *(engine._analyze_company_with_ai(research_data(f"Company{i}")) for i in range(ANALYSIS_BATCH_SIZE))
+    ), timeout=1)
+
+    assert len(client.calls) == 1
+    assert len(analyses) == ANALYSIS_BATCH_SIZE
+    assert engine._analysis_flush is None
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_is_delivered_to_every_waiter(engine, fake_openai, monkeypatch):
+    fake_openai(reply_per_company)
+
+    async def failing_batch(research_data_list):
+        raise RuntimeError("upstream down")
+    monkeypatch.setattr(engine, "analyze_companies_batch", failing_batch)
+
+    analyses = await asyncio.gather(
+        *(engine._analyze_company_with_ai(research_data(name)) for name in ("Acme", "Globex", "Initech"))
+    )
+
+    assert analyses == [{"analysis": "AI analysis failed"}] * 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_the_others(engine, fake_openai):
+    client = fake_openai(reply_per_company)
+
+    waiters = [
+        asyncio.ensure_future(engine._analyze_company_with_ai(research_data(name)))
+        for name in ("Acme", "Globex", "Initech")
+    ]
+    await asyncio.sleep(0)
+    waiters[1].cancel()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert results[0] == analysis_for("company 0")
+    assert results[2] == analysis_for("company 2")
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_the_engine_mid_batch_releases_every_waiter(engine, monkeypatch):
+    batch_started = asyncio.Event()
+
+    async def stalled_batch(research_data_list):
+        batch_started.set()
+        await asyncio.Event().wait()
+    monkeypatch.setattr(engine, "analyze_companies_batch", stalled_batch)
+    engine._llm_clients["openai"] = object()
+
+    waiters = [
+        asyncio.ensure_future(engine._analyze_company_with_ai(research_data(name)))
+        for name in ("Acme", "Globex")
+    ]
+    await asyncio.wait_for(batch_started.wait(), timeout=1)
+    await engine.aclose()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+def test_batch_response_format_requires_exactly_the_sent_ids():
+    response_format = RealResearchEngine._analysis_batch_response_format([1, 4])
+    schema = response_format["json_schema"]["schema"]
+
+    assert response_format["json_schema"]["strict"] is True
+    assert schema["required"] == ["1", "4"]
+    assert set(schema["properties"]) == {"1", "4"}
+    assert schema["additionalProperties"] is False
+
+
+@pytest.mark.asyncio
+async def test_batch_reply_ids_map_back_to_input_positions(engine, fake_openai):
+    client = fake_openai(reply_per_company)
+    cached_key = engine._prepare_analysis(research_data("Acme"))[1]
+    engine._cache_analysis(cached_key, analysis_for("cached"))
+
+    analyses = await engine.analyze_companies_batch(
+        [research_data("Acme"), research_data("Globex"), research_data("Initech")]
+    )
+
+    # Only the uncached companies are sent, under their original positions
+    assert client.calls[0]["response_format"]["json_schema"]["schema"]["required"] == ["1", "2"]
+    assert analyses == [analysis_for("cached"), analysis_for("company 1"), analysis_for("company 2")]
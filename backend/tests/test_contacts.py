@@ -0,0 +1,35 @@
+import pytest
+
+from backend.services import real_research
+
+
+@pytest.fixture
+def scrapes(monkeypatch):
+    calls = []
+
+    async def scrape_company_contacts(company_name, website, target_roles, strict_targeting):
+        calls.append(website)
+        return [{"contact_name": f"Person at {company_name}", "role": "CEO"}]
+    monkeypatch.setattr(real_research, "scrape_company_contacts", scrape_company_contacts)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_companies_without_a_domain_do_not_share_cached_contacts(engine, scrapes):
+    alpha = await engine.find_company_contacts({"name": "Alpha"})
+    beta = await engine.find_company_contacts({"name": "Beta", "domain": ""})
+
+    assert [contact["contact_name"] for contact in alpha] == ["Person at Alpha"]
+    assert [contact["contact_name"] for contact in beta] == ["Person at Beta"]
+    assert len(scrapes) == 2
+
+
+@pytest.mark.asyncio
+async def test_contacts_are_cached_per_scraped_host(engine, scrapes):
+    await engine.find_company_contacts({"name": "Acme", "website": "https://www.acme.com/about"})
+    cached = await engine.find_company_contacts({"name": "Acme", "domain": "acme.com", "website": "https://acme.com"})
+    other = await engine.find_company_contacts({"name": "Globex", "domain": "acme.com", "website": "https://globex.com"})
+
+    assert scrapes == ["https://www.acme.com/about", "https://globex.com"]
+    assert cached[0]["contact_name"] == "Person at Acme"
+    assert other[0]["contact_name"] == "Person at Globex"
@@ -0,0 +1,40 @@
+import asyncio
+
+from backend.services.real_research import RealResearchEngine
+
+
+async def open_clients(engine):
+    return engine._get_session(), engine._llm_http_client
+
+
+async def open_clients_and_drain(engine):
+    clients = await open_clients(engine)
+    # Let the scheduled close of the previous loop's clients run
+    await asyncio.gather(*engine._background_tasks)
+    return clients
+
+
+def test_clients_from_a_closed_loop_are_detached():
+    engine = RealResearchEngine()
+    first_session, _ = asyncio.run(open_clients(engine))
+
+    second_session, _ = asyncio.run(open_clients(engine))
+
+    assert first_session.closed
+    assert second_session is not first_session
+    asyncio.run(engine.aclose())
+
+
+def test_clients_from_a_stopped_loop_are_closed():
+    engine = RealResearchEngine()
+    first_loop = asyncio.new_event_loop()
+    try:
+        first_session, first_client = first_loop.run_until_complete(open_clients(engine))
+
+        asyncio.run(open_clients_and_drain(engine))
+
+        assert first_session.closed
+        assert first_client is None or first_client.is_closed
+    finally:
+        first_loop.close()
+    asyncio.run(engine.aclose())
@@ -0,0 +1,28 @@
+import pytest
+
+from backend.services import real_research
+from backend.services.real_research import WEBSITE_MAX_CHARS, _html_to_text
+
+PAGE = """<html><head><title>Acme</title><style>body { color: red }</style></head>
+<body><h1>Acme   Corp</h1><script>track()</script><noscript>Enable JS</noscript>
+<p>We build <b>payment</b> software.</p><template><p>hidden</p></template></body></html>"""
+
+
+@pytest.fixture(params=["selectolax", "bs4"])
+def parser(request, monkeypatch):
+    if request.param == "selectolax":
+        pytest.importorskip("selectolax.lexbor")
+    else:
+        pytest.importorskip("bs4")
+        # Force the BeautifulSoup fallback even when selectolax is installed
+        monkeypatch.setattr(real_research, "SELECTOLAX_AVAILABLE", False)
+    return request.param
+
+
+def test_visible_text_without_scripts_styles_or_templates(parser):
+    assert _html_to_text(PAGE) == "Acme Acme Corp We build payment software."
+
+
+def test_text_is_capped(parser):
+    html = "<p>" + "word " * WEBSITE_MAX_CHARS + "</p>"
+    assert len(_html_to_text(html)) == WEBSITE_MAX_CHARS
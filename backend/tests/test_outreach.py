@@ -0,0 +1,144 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import outreach_generator
+from backend.services.outreach_generator import OutreachGenerator
+
+
+COMPANY_ROW = {"id": "c-1", "name": "Acme", "website": "https://acme.com"}
+CONTACT_ROWS = [
+    {"id": "p-1", "company_id": "c-1", "first_name": "Jane", "last_name": "Doe", "title": "CFO"},
+    {"id": "p-2", "company_id": "c-1", "first_name": "John", "last_name": "Roe", "title": "CTO"},
+]
+
+
+def contact_line(prompt):
+    return next(line for line in prompt.splitlines() if line.startswith("Contact: "))
+
+
+def reply_with_contact_line(call):
+    line = contact_line(call["messages"][1]["content"])
+    return {"linkedin_message": line, "email_subject": "Hello", "email_body": line}
+
+
+@pytest.mark.asyncio
+async def test_contacts_at_one_company_get_their_own_outreach(engine, fake_openai):
+    client = fake_openai(reply_with_contact_line)
+
+    # Lead shape built by OutreachGenerator.generate_company_outreach
+    first, second = [
+        await engine.generate_personalized_outreach({"company": COMPANY_ROW, "contact": contact})
+        for contact in CONTACT_ROWS
+    ]
+
+    assert len(client.calls) == 2
+    assert first["linkedin_message"] == "Contact: Jane Doe (CFO) at Acme"
+    assert second["linkedin_message"] == "Contact: John Roe (CTO) at Acme"
+
+
+@pytest.mark.asyncio
+async def test_flat_leads_still_render_contact_and_role(engine, fake_openai):
+    fake_openai(reply_with_contact_line)
+
+    outreach = await engine.generate_personalized_outreach(
+        {"company": "Acme", "contact_name": "Jane Doe", "role": "CFO"}
+    )
+
+    assert outreach["linkedin_message"] == "Contact: Jane Doe (CFO) at Acme"
+
+
+def reply_per_contact_id(call):
+    prompt = call["messages"][1]["content"]
+    contacts = json.loads(next(line for line in prompt.splitlines() if line.startswith("Contacts: "))[10:])
+    return {
+        contact["contact_id"]: {
+            "linkedin_message": f"Hi {contact['name']}",
+            "email_subject": f"For the {contact['role']}",
+            "email_body": f"Hi {contact['name']}, a note for the {contact['role']}.",
+        }
+        for contact in contacts
+    }
+
+
+@pytest.mark.asyncio
+async def test_batched_outreach_is_yielded_under_each_contacts_index(engine, fake_openai):
+    client = fake_openai(reply_per_contact_id)
+
+    yielded = [
+        item async for item in engine.iter_personalized_outreach(
+            [{"company": COMPANY_ROW, "contact": contact} for contact in CONTACT_ROWS]
+        )
+    ]
+
+    assert len(client.calls) == 1
+    assert dict(yielded) == {
+        0: {"linkedin_message": "Hi Jane Doe", "email_subject": "For the CFO",
+            "email_body": "Hi Jane Doe, a note for the CFO."},
+        1: {"linkedin_message": "Hi John Roe", "email_subject": "For the CTO",
+            "email_body": "Hi John Roe, a note for the CTO."},
+    }
+
+
+class FakeDb:
+    def __init__(self):
+        self.inserted = []
+
+    async def fetch_all(self, query, *args):
+        return CONTACT_ROWS
+
+    async def fetch_one(self, query, *args):
+        return COMPANY_ROW
+
+    async def execute(self, query, *args):
+        self.inserted.append(args)
+
+
+@pytest.mark.asyncio
+async def test_outreach_generator_stores_each_contacts_outreach(engine, fake_openai, monkeypatch):
+    fake_openai(reply_per_contact_id)
+    monkeypatch.setattr(outreach_generator, "iter_personalized_outreach", engine.iter_personalized_outreach)
+
+    generated = await OutreachGenerator(db=FakeDb()).generate_company_outreach("c-1")
+
+    assert [(item.contact_id, item.subject) for item in generated] == [("p-1", "For the CFO"), ("p-2", "For the CTO")]
+
+
+class FailingOpenAI:
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        raise RuntimeError("upstream error")
+
+
+class FakeClaude:
+    def __init__(self):
+        self.calls = 0
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        # Claude continues the prefilled "{"
+        reply = '"linkedin_message": "Hi", "email_subject": "Hello", "email_body": "Hi there"}'
+        return SimpleNamespace(content=[SimpleNamespace(text=reply)])
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_stops_receiving_outreach_calls(engine):
+    openai, claude = FailingOpenAI(), FakeClaude()
+    engine._llm_clients.update(openai=openai, claude=claude)
+
+    for i in range(5):
+        outreach = await engine.generate_personalized_outreach(
+            {"company": "Acme", "contact_name": f"Contact {i}", "role": "CFO"}
+        )
+        assert outreach["email_subject"] == "Hello"
+
+    # Both start at the same latency; one failure is enough to route around OpenAI
+    assert openai.calls == 1
+    assert claude.calls == 5
+    assert engine._providers_by_latency() == ["claude", "openai"]
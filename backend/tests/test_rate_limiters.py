@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services import real_research
+from backend.services.real_research import AdaptiveConcurrencyLimiter, SlidingWindowRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(real_research, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def test_adaptive_limiter_increase_is_capped_at_maximum():
+    limiter = AdaptiveConcurrencyLimiter(initial=5, maximum=10, increase=0.5)
+    for _ in range(9):
+        limiter.on_success()
+    assert limiter.limit == 9.5
+    for _ in range(5):
+        limiter.on_success()
+    assert limiter.limit == 10
+
+
+def test_adaptive_limiter_decrease_is_floored_at_minimum():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, minimum=1, decrease=0.5)
+    limiter.on_overload()
+    assert limiter.limit == 4
+    for _ in range(5):
+        limiter.on_overload()
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_admits_up_to_the_current_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=2)
+    limiter.on_overload()  # limit 1
+
+    await limiter.__aenter__()
+    waiter = asyncio.ensure_future(limiter.__aenter__())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await limiter.__aexit__(None, None, None)
+    await asyncio.wait_for(waiter, 1)
+    assert limiter._in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_waits_for_the_oldest_request_to_expire(clock):
+    limiter = SlidingWindowRateLimiter(((2, 1.0),))
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock.sleeps == [1.0]
+    assert clock.now == 101.0
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_waits_for_every_window(clock):
+    limiter = SlidingWindowRateLimiter(((2, 1.0), (3, 10.0)))
+    for _ in range(4):
+        await limiter.acquire()
+    # Third call waits out the 1s window, fourth the 10s window opened at t=100
+    assert clock.sleeps == [1.0, 9.0]
+    assert clock.now == 110.0
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_does_not_wait_under_the_limit(clock):
+    limiter = SlidingWindowRateLimiter(((2, 1.0),))
+    await limiter.acquire()
+    clock.now += 0.6
+    await limiter.acquire()
+    clock.now += 0.6
+    await limiter.acquire()  # the first request left the window at t=101
+    assert clock.sleeps == []
@@ -0,0 +1,213 @@
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+
+from backend.services import research_engine
+from backend.services.real_research import ANALYSIS_FIELDS
+from backend.services.research_engine import (
+    PROFILE_CHANGED_CHANNEL,
+    PROFILE_JSON_FIELDS,
+    PROFILE_TTL_SECONDS,
+    PROFILE_UPSERT_SQL,
+    ResearchEngine,
+)
+
+COMPANY_ROW = {"id": "c-1", "name": "Acme", "website": "https://acme.com", "description": "Payments platform"}
+ANALYSIS = {field: [f"{field} 1", f"{field} 2"] for field in ANALYSIS_FIELDS}
+PROFILE_COLUMNS = ("id", "company_id", *PROFILE_JSON_FIELDS, "research_confidence", "created_at", "updated_at")
+
+
+class FakeDb:
+    """companies and company_profiles tables; JSONB values round-trip through JSON like the pool codec"""
+
+    connection_string = "postgresql://localhost/test"
+
+    def __init__(self):
+        self.profiles = {}
+
+    async def fetch_one(self, query, *args):
+        if "FROM companies" in query:
+            return COMPANY_ROW if args[0] == COMPANY_ROW["id"] else None
+        profile = self.profiles.get(args[0])
+        if profile is not None and (len(args) == 1 or profile["updated_at"] > args[1]):
+            return profile
+        return None
+
+    async def execute(self, query, *args):
+        assert query == PROFILE_UPSERT_SQL
+        row = dict(zip(PROFILE_COLUMNS, args))
+        for field in PROFILE_JSON_FIELDS:
+            row[field] = json.loads(json.dumps(row[field]))
+        self.profiles[row["company_id"]] = row
+
+
+@pytest.fixture
+def research_calls(engine, fake_openai, monkeypatch):
+    """Route ResearchEngine through the real research pipeline with a stubbed LLM and website"""
+    fake_openai(lambda call: ANALYSIS)
+
+    async def fetch_website(url):
+        return "Acme builds payment software", ["Python"]
+    monkeypatch.setattr(engine, "_fetch_website", fetch_website)
+
+    calls = []
+
+    async def research_company_deep(company):
+        calls.append(company["id"])
+        return await engine.research_company_deep(dict(company))
+    monkeypatch.setattr(research_engine, "research_company_deep", research_company_deep)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_research_output_is_mapped_onto_the_profile(research_calls):
+    db = FakeDb()
+    engine = ResearchEngine(db)
+
+    profile = await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+
+    assert profile is not None
+    assert profile.company_id == "c-1"
+    assert profile.research_summary.company_overview == "Payments platform"
+    assert profile.pain_points.operational_challenges == ANALYSIS["pain_points"]
+    assert profile.pain_points.technology_gaps == ANALYSIS["technology_needs"]
+    assert profile.growth_signals.expansion_plans == ANALYSIS["growth_signals"]
+    assert profile.buying_triggers.immediate_needs == ANALYSIS["buying_triggers"]
+    assert profile.buying_triggers.decision_makers == ANALYSIS["key_decision_makers"]
+    assert profile.reasons_to_reach_out == ANALYSIS["reasons_to_reach_out"]
+    assert profile.sources == [{"type": "website", "url": "https://acme.com"}]
+    assert profile.research_confidence == 1.0
+    assert db.profiles["c-1"]["id"] == profile.id
+
+
+@pytest.mark.asyncio
+async def test_failed_profile_write_is_logged(research_calls, caplog):
+    db = FakeDb()
+
+    async def failing_execute(query, *args):
+        raise ConnectionError("database unavailable")
+    db.execute = failing_execute
+    engine = ResearchEngine(db)
+
+    profile = await engine.research_company("c-1")
+    await engine.aclose()
+
+    assert profile is not None
+    assert "Failed to store research profile for company c-1" in caplog.text
+    assert engine._pending_writes == set()
+
+
+@pytest.mark.asyncio
+async def test_fresh_stored_profile_is_served_without_new_research(research_calls):
+    db = FakeDb()
+    engine = ResearchEngine(db)
+    await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+
+    # A new engine has an empty in-process cache, so this hit comes from company_profiles
+    profile = await ResearchEngine(db).research_company("c-1")
+
+    assert research_calls == ["c-1"]
+    assert profile.id == db.profiles["c-1"]["id"]
+    assert profile.pain_points.operational_challenges == ANALYSIS["pain_points"]
+
+
+@pytest.mark.asyncio
+async def test_expired_stored_profile_is_researched_again(research_calls):
+    db = FakeDb()
+    engine = ResearchEngine(db)
+    await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+    db.profiles["c-1"]["updated_at"] -= timedelta(seconds=PROFILE_TTL_SECONDS + 1)
+
+    await engine.research_company("c-1")
+
+    assert research_calls == ["c-1", "c-1"]
+
+
+@pytest.mark.asyncio
+async def test_stored_profile_in_the_old_flat_shape_is_researched_again(research_calls):
+    db = FakeDb()
+    engine = ResearchEngine(db)
+    await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+    db.profiles["c-1"]["pain_points"] = ANALYSIS["pain_points"]
+
+    profile = await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+
+    assert research_calls == ["c-1", "c-1"]
+    assert db.profiles["c-1"]["pain_points"]["operational_challenges"] == ANALYSIS["pain_points"]
+    assert profile.pain_points.operational_challenges == ANALYSIS["pain_points"]
+
+
+class FakeListenConnection:
+    """asyncpg connection as used by the profile change listener"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.drop()
+
+    def drop(self):
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    def notify(self, payload):
+        self.listeners[PROFILE_CHANGED_CHANNEL](self, 1, PROFILE_CHANGED_CHANNEL, payload)
+
+
+async def wait_until(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_listener_evicts_changed_profiles_and_reconnects(research_calls, monkeypatch):
+    connections = []
+
+    async def connect(dsn):
+        connections.append(FakeListenConnection())
+        return connections[-1]
+    monkeypatch.setattr(research_engine.asyncpg, "connect", connect)
+    monkeypatch.setattr(research_engine, "LISTENER_RECONNECT_DELAY_SECONDS", 0)
+
+    engine = ResearchEngine(FakeDb())
+    await engine.research_company("c-1")
+    await engine.flush_pending_writes()
+    await engine.start()
+    await wait_until(lambda: engine._listener_connection is not None)
+
+    await engine.get_company_profile("c-1")
+    assert "c-1" in engine._profile_cache
+    connections[0].notify("c-1")
+    assert "c-1" not in engine._profile_cache
+
+    # Notifications sent while the listener was down are lost, so a reconnect clears the cache
+    await engine.get_company_profile("c-1")
+    connections[0].drop()
+    await wait_until(lambda: len(connections) == 2 and engine._listener_connection is connections[1])
+    assert engine._profile_cache == {}
+
+    await engine.aclose()
+    assert connections[1].closed
+    assert engine._listener_connection is None
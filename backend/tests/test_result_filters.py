@@ -0,0 +1,23 @@
+import pytest
+
+from backend.services.real_research import _is_job_board_url
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.indeed.com/viewjob?jk=1",
+    "https://uk.indeed.com/",
+    "https://www.linkedin.com/jobs/view/123",
+    "https://linkedin.com/jobs",
+])
+def test_job_board_hosts_and_subdomains_match(url):
+    assert _is_job_board_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://notindeed.com/",
+    "https://dice.com.example.io/",
+    "https://acme.com/careers?ref=indeed.com",
+    "https://www.linkedin.com/company/acme",
+])
+def test_other_hosts_and_paths_do_not_match(url):
+    assert not _is_job_board_url(url)
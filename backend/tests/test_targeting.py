@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_short_prompt_is_parsed_without_the_llm(engine, fake_openai):
+    client = fake_openai(lambda call: pytest.fail("the LLM should not be called"))
+
+    def no_cache(key):
+        raise AssertionError("the fast path should run before the cache lookup")
+
+    engine._get_cached_response = no_cache
+
+    criteria = await engine.extract_targeting_criteria("B2B SaaS startups in Berlin")
+
+    assert criteria == {"keywords": ["B2B", "SaaS"], "industry": "SaaS",
+                        "location": "Berlin", "search_queries": []}
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prompt", [
+    "Find CTOs at SaaS companies in Berlin",
+    "SaaS founders in Berlin",
+    "SaaS startups in Berlin with 50-200 employees",
+    "Small B2B SaaS companies in Berlin",
+])
+async def test_role_and_size_prompts_go_to_the_llm(engine, prompt):
+    assert engine._parse_trivial_prompt(prompt) is None
+
+
+@pytest.mark.asyncio
+async def test_excluded_terms_match_whole_words_only(engine):
+    assert engine._parse_trivial_prompt("B2B SaaS startups in Fundy")["location"] == "Fundy"
+    assert engine._parse_trivial_prompt("B2B SaaS startups in Capital City") is None